@@ -0,0 +1,72 @@
+"""Command line benchmark of the inference backends: load time, batch latency and peak RSS.
+
+Example:
+    python -m backend.src.benchmark_backends --model backend/model.h5 --batch-sizes 1 8 32
+
+Every variant (Keras and the TFLite float32, float16 and int8 flatbuffers) runs in its own process,
+so the reported peak RSS is that of one loaded backend only. Pass --variant to run a single one.
+"""
+
+import argparse
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from backend.src.services.inference_backends import TFLITE_QUANTIZATIONS, load_backend
+from backend.src.services.keypoints import KEYPOINT_DTYPE, KEYPOINT_FEATURES, SEQUENCE_LENGTH
+
+VARIANTS = ("keras", *(f"tflite-{quantization}" for quantization in TFLITE_QUANTIZATIONS))
+
+
+def benchmark(variant: str, model_path: str, batch_sizes: list[int], runs: int, num_threads: int | None) -> None:
+    """Load one backend variant, time its predictions and print one line per batch size."""
+    name, _, quantization = variant.partition("-")
+    start = time.perf_counter()
+    backend = load_backend(name, model_path, quantization or "float32", num_threads)
+    backend.warm_up()
+    load_s = time.perf_counter() - start
+
+    rng = np.random.default_rng(0)
+    for batch_size in batch_sizes:
+        sequences = rng.random((batch_size, SEQUENCE_LENGTH, KEYPOINT_FEATURES), dtype=KEYPOINT_DTYPE)
+        backend.predict(sequences)
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            backend.predict(sequences)
+            timings.append(time.perf_counter() - start)
+        p50, p95 = np.percentile(timings, [50, 95]) * 1000
+        # ru_maxrss is reported in KiB on Linux.
+        peak_rss_mib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(  # noqa: T201
+            f"{variant:<16} batch={batch_size:<4} load={load_s:6.2f}s p50={p50:8.2f}ms p95={p95:8.2f}ms "
+            f"per_sequence={p50 / batch_size:7.2f}ms peak_rss={peak_rss_mib:8.1f}MiB"
+        )
+
+
+def main() -> None:
+    """Parse the command line arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="backend/model.h5", help="The path of the H5 model file.")
+    parser.add_argument("--variant", choices=VARIANTS, default=None, help="Run only this backend variant.")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 8, 32], help="The batch sizes to time.")
+    parser.add_argument("--runs", type=int, default=20, help="The number of timed predictions per batch size.")
+    parser.add_argument("--threads", type=int, default=None, help="The number of TFLite interpreter threads.")
+    args = parser.parse_args()
+
+    if args.variant:
+        benchmark(args.variant, args.model, args.batch_sizes, args.runs, args.threads)
+        return
+    for variant in VARIANTS:
+        command = [sys.executable, "-m", __spec__.name, "--variant", variant, "--model", args.model]
+        command += ["--batch-sizes", *map(str, args.batch_sizes), "--runs", str(args.runs)]
+        if args.threads:
+            command += ["--threads", str(args.threads)]
+        subprocess.run(command, check=True)  # noqa: S603
+
+
+if __name__ == "__main__":
+    main()
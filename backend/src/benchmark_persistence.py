@@ -0,0 +1,144 @@
+"""Command line benchmark of the database time of storing one translated recording.
+
+Example:
+    python -m backend.src.benchmark_persistence --requests 200 --frames 30
+
+Compares the ORM write path the translate endpoints used before `RecordingService` (a commit and
+refresh for the recording, one ORM object and a commit for the images, a re-fetch of the recording,
+the keypoints and a final commit, then the trailing commit of `get_session`) with
+`RecordingService.save_translation`. Frames are referenced by random hashes, so only the database
+is timed, not the frame store.
+
+The tables are created if missing, never dropped. All rows are written for a dedicated benchmark
+user, which is deleted with its recordings at the end.
+"""
+
+import argparse
+import asyncio
+import secrets
+import time
+from collections.abc import Awaitable, Callable
+
+import numpy as np
+from sqlalchemy import delete, event
+from sqlmodel import SQLModel
+
+from backend.src.db import async_session, engine
+from backend.src.db_models import Image, Recording, User
+from backend.src.services.frame_store import StoredFrame
+from backend.src.services.keypoint_service import keypoint_service
+from backend.src.services.keypoints import KEYPOINT_DTYPE, KEYPOINT_FEATURES
+from backend.src.services.recording_service import recording_service
+
+SaveTranslation = Callable[[int, list[StoredFrame], np.ndarray, str], Awaitable[int]]
+
+
+async def orm_save_translation(user_id: int, images: list[StoredFrame], keypoints: np.ndarray, prediction: str) -> int:
+    """Store a recording the way the translate endpoints did before `RecordingService`."""
+    async with async_session() as session:
+        recording = Recording(user_id=user_id)
+        session.add(recording)
+        await session.commit()
+        await session.refresh(recording)
+
+        for img in images:
+            session.add(Image(recording_id=recording.id, **img.model_dump()))
+        await session.commit()
+
+        recording = await session.get(Recording, recording.id)
+        recording.prediction = prediction
+        session.add(keypoint_service.pack(recording.id, keypoints))
+        await session.commit()
+        # The trailing commit of `get_session`.
+        await session.commit()
+        return recording.id
+
+
+async def service_save_translation(
+    user_id: int, images: list[StoredFrame], keypoints: np.ndarray, prediction: str
+) -> int:
+    """Store a recording with `RecordingService.save_translation`."""
+    async with async_session() as session:
+        recording_id = await recording_service.save_translation(session, user_id, images, keypoints, prediction)
+        # The trailing commit of `get_session`.
+        await session.commit()
+        return recording_id
+
+
+def random_frames(rng: np.random.Generator, frames: int) -> list[StoredFrame]:
+    """Return references to random frames of a typical JPEG size."""
+    return [
+        StoredFrame(content_hash=secrets.token_hex(32), size=int(rng.integers(20_000, 60_000)), format="jpeg")
+        for _ in range(frames)
+    ]
+
+
+async def run(save: SaveTranslation, user_id: int, requests: int, frames: int) -> tuple[list[float], int]:
+    """Store recordings one request at a time, returning the time of every request and the statement count."""
+    rng = np.random.default_rng(0)
+    statements = 0
+
+    def count(*_: object) -> None:
+        nonlocal statements
+        statements += 1
+
+    timings = []
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    try:
+        for _ in range(requests):
+            images = random_frames(rng, frames)
+            keypoints = rng.random((frames, KEYPOINT_FEATURES), dtype=KEYPOINT_DTYPE)
+            start = time.perf_counter()
+            await save(user_id, images, keypoints, "hello")
+            timings.append(time.perf_counter() - start)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count)
+    return timings, statements
+
+
+async def benchmark(requests: int, frames: int, warmup: int) -> None:
+    """Time both write paths and print one line per path."""
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with async_session() as session:
+        user = User(
+            username=f"benchmark-{secrets.token_hex(4)}",
+            email=f"benchmark-{secrets.token_hex(4)}@example.com",
+            hashed_password="",
+        )
+        session.add(user)
+        await session.commit()
+        user_id = user.id
+
+    try:
+        paths = {"orm": orm_save_translation, "recording_service": service_save_translation}
+        for save in paths.values():
+            await run(save, user_id, warmup, frames)
+        for name, save in paths.items():
+            timings, statements = await run(save, user_id, requests, frames)
+            mean = 1000 * np.mean(timings)
+            p50, p95 = 1000 * np.percentile(timings, [50, 95])
+            print(  # noqa: T201
+                f"{name:<18} requests={requests} frames={frames} mean={mean:7.2f}ms p50={p50:7.2f}ms "
+                f"p95={p95:7.2f}ms statements/request={statements / requests:5.1f}"
+            )
+    finally:
+        async with async_session() as session:
+            await session.execute(delete(User).where(User.id == user_id))
+            await session.commit()
+        await engine.dispose()
+
+
+def main() -> None:
+    """Parse the command line arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200, help="The number of timed requests per write path.")
+    parser.add_argument("--frames", type=int, default=30, help="The number of frames per recording.")
+    parser.add_argument("--warmup", type=int, default=20, help="The number of untimed requests per write path.")
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.requests, args.frames, args.warmup))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""In-process caches for the backend application."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Thread-safe, size-bounded LRU cache whose entries expire after a fixed time to live.
+
+    Attributes:
+        capacity (int): The maximum number of entries, the least recently used entry is evicted first.
+            A capacity of 0 disables the cache.
+        ttl_seconds (float): How long an entry stays valid after it was set.
+    """
+
+    def __init__(self, capacity: int, ttl_seconds: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            capacity (int): The maximum number of entries, 0 disables the cache.
+            ttl_seconds (float): How long an entry stays valid after it was set.
+        """
+        self.capacity = capacity
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        """Return the number of entries, including expired ones not evicted yet."""
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value of a key, None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def set(self, key: K, value: V) -> None:
+        """Cache a value, evicting the least recently used entry when the cache is full."""
+        if self.capacity <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def pop(self, key: K) -> V | None:
+        """Remove a key from the cache, returning its value if it was cached."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            return entry[1] if entry else None
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return the cache configuration, size and hit/miss counters."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "capacity": self.capacity,
+                "ttl_s": self.ttl_seconds,
+                "size": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+            }
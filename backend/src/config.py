@@ -12,6 +12,14 @@ class DBSettings(BaseSettings):
         POSTGRES_SERVER (str): The server address for the PostgreSQL database.
         POSTGRES_PORT (int): The port number for the PostgreSQL database.
         POSTGRES_DB (str): The name of the PostgreSQL database.
+        POOL_SIZE (int): The number of connections kept open in the pool.
+        MAX_OVERFLOW (int): The number of connections opened on top of the pool size under load.
+        POOL_TIMEOUT (float): How many seconds a request waits for a free connection.
+        POOL_PRE_PING (bool): Whether to test a connection before checking it out.
+        POOL_RECYCLE (int): The number of seconds after which a connection is reopened, -1 never.
+        SQL_ECHO (bool): Whether to log every SQL statement.
+        STATEMENT_CACHE_SIZE (int): The size of the prepared statement caches of SQLAlchemy and asyncpg per
+            connection, 0 disables them.
     """
 
     POSTGRES_USER: str
@@ -19,6 +27,13 @@ class DBSettings(BaseSettings):
     POSTGRES_SERVER: str
     POSTGRES_PORT: int
     POSTGRES_DB: str
+    POOL_SIZE: int = 10
+    MAX_OVERFLOW: int = 10
+    POOL_TIMEOUT: float = 30.0
+    POOL_PRE_PING: bool = True
+    POOL_RECYCLE: int = 1800
+    SQL_ECHO: bool = False
+    STATEMENT_CACHE_SIZE: int = 100
 
     @property
     def database_url(self) -> str:
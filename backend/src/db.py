@@ -1,17 +1,84 @@
 """Database configuration."""
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+import threading
+import time
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
 from sqlmodel import SQLModel
 
 from backend.src.config import DBSettings
 
-engine = create_async_engine(DBSettings().database_url, echo=True)
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Connection pool that records how long checkouts wait for a free connection."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize the pool and its checkout counters."""
+        super().__init__(*args, **kwargs)
+        self._metrics_lock = threading.Lock()
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        """Check out a connection, timing the wait for it."""
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except Exception:
+            with self._metrics_lock:
+                self._timeouts += 1
+            raise
+        waited = time.perf_counter() - start
+        with self._metrics_lock:
+            self._checkouts += 1
+            self._wait_seconds += waited
+            self._max_wait_seconds = max(self._max_wait_seconds, waited)
+        return connection
+
+    def stats(self) -> dict:
+        """Return the pool occupancy and checkout counters."""
+        with self._metrics_lock:
+            return {
+                "size": self.size(),
+                "checked_in": self.checkedin(),
+                "checked_out": self.checkedout(),
+                "overflow": max(self.overflow(), 0),
+                "max_overflow": self._max_overflow,
+                "timeout_s": self.timeout(),
+                "checkouts": self._checkouts,
+                "failed_checkouts": self._timeouts,
+                "avg_wait_ms": 1000 * self._wait_seconds / self._checkouts if self._checkouts else 0.0,
+                "max_wait_ms": 1000 * self._max_wait_seconds,
+            }
+
+
+db_settings = DBSettings()
+engine = create_async_engine(
+    db_settings.database_url,
+    echo=db_settings.SQL_ECHO,
+    poolclass=InstrumentedQueuePool,
+    pool_size=db_settings.POOL_SIZE,
+    max_overflow=db_settings.MAX_OVERFLOW,
+    pool_timeout=db_settings.POOL_TIMEOUT,
+    pool_pre_ping=db_settings.POOL_PRE_PING,
+    pool_recycle=db_settings.POOL_RECYCLE,
+    # SQLAlchemy prepares every statement itself and caches them under its own DBAPI argument, on top of
+    # the asyncpg cache, so both are sized together.
+    connect_args={
+        "statement_cache_size": db_settings.STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": db_settings.STATEMENT_CACHE_SIZE,
+    },
+)
+async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
 async def get_session() -> AsyncSession:
     """Get a new session."""
-    session = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)()  # type: ignore
+    session = async_session()
     try:
         yield session
         await session.commit()
@@ -19,6 +86,11 @@ async def get_session() -> AsyncSession:
         await session.close()
 
 
+def pool_stats() -> dict:
+    """Return the statistics of the engine connection pool."""
+    return engine.pool.stats()
+
+
 async def init_db() -> None:
     """Initialize the database."""
     async with engine.begin() as conn:
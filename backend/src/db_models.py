@@ -1,19 +1,25 @@
 """This module defines the SQLModel models for the Sign Language Translator application."""
 
 import datetime
+from typing import Optional
 
 from sqlmodel import Field, Relationship, SQLModel
 
 from backend.src.utils import hash_password
 
+# Relationships are never loaded implicitly: a lazy load does not work on an AsyncSession and turns
+# list views into N+1 queries. Queries opt into `selectinload`/`joinedload` for what they return, and
+# deletes rely on the ON DELETE CASCADE foreign keys instead of loading the children.
+NO_LAZY_LOAD = {"lazy": "raise"}
+
 
 class User(SQLModel, table=True):
     """Represents a user in the system.
 
     Attributes:
         id (int | None): The unique identifier for the user. Defaults to None.
-        username (str): The username of the user.
-        email (str): The email address of the user.
+        username (str): The unique username of the user.
+        email (str): The unique email address of the user.
         hashed_password (str): The hashed password of the user.
         is_active (bool): Indicates whether the user is active. Defaults to True.
         is_admin (bool): Indicates whether the user is an admin. Defaults to False.
@@ -22,13 +28,15 @@ class User(SQLModel, table=True):
     """
 
     id: int | None = Field(primary_key=True, default=None)
-    username: str
-    email: str
+    username: str = Field(unique=True, index=True)
+    email: str = Field(unique=True, index=True)
     hashed_password: str
     is_active: bool = True
     is_admin: bool = False
 
-    recordings: list["Recording"] = Relationship(back_populates="user", cascade_delete=True)
+    recordings: list["Recording"] = Relationship(
+        back_populates="user", cascade_delete=True, passive_deletes=True, sa_relationship_kwargs=NO_LAZY_LOAD
+    )
 
 
 class Recording(SQLModel, table=True):
@@ -41,25 +49,40 @@ class Recording(SQLModel, table=True):
         prediction (str | None): The predicted translation of the recording.
         feedback (int | None): The feedback score for the recording.
         images (list["Image"]): A list of images associated with the recording.
+        keypoints (Keypoints | None): The keypoint sequence extracted from the recording.
         user (User): The user who created the recording.
     """
 
     id: int | None = Field(primary_key=True, default=None)
-    user_id: int = Field(foreign_key="user.id", ondelete="CASCADE")
-    created_at: datetime.datetime = Field(default_factory=datetime.datetime.now)
+    user_id: int = Field(foreign_key="user.id", ondelete="CASCADE", index=True)
+    created_at: datetime.datetime = Field(default_factory=datetime.datetime.now, index=True)
     prediction: str | None = None  # change to ENUM
     feedback: int | None = None
 
-    images: list["Image"] = Relationship(back_populates="recording", cascade_delete=True)
-    user: User = Relationship(back_populates="recordings")
+    images: list["Image"] = Relationship(
+        back_populates="recording", cascade_delete=True, passive_deletes=True, sa_relationship_kwargs=NO_LAZY_LOAD
+    )
+    # SQLModel resolves the relationship target from the annotation, and only resolves a forward
+    # reference wrapped in Optional, not a "Keypoints | None" string.
+    keypoints: Optional["Keypoints"] = Relationship(
+        back_populates="recording",
+        cascade_delete=True,
+        passive_deletes=True,
+        sa_relationship_kwargs={**NO_LAZY_LOAD, "uselist": False},
+    )
+    user: User = Relationship(back_populates="recordings", sa_relationship_kwargs=NO_LAZY_LOAD)
 
 
 class Image(SQLModel, table=True):
     """Represents an image associated with a recording in the database.
 
+    The encoded image bytes are kept in the frame store, the row only references them by content hash.
+
     Attributes:
         id (int | None): The primary key of the image. Defaults to None.
-        content (bytes): The binary content of the image.
+        content_hash (str): The SHA-256 hex digest of the image bytes, their key in the frame store.
+        size (int): The size of the encoded image in bytes.
+        format (str): The image format, "jpeg" or "png".
         recording_id (int): The foreign key referencing the associated recording.
                             This field is set to cascade on delete.
         recording (Recording): The relationship to the Recording model,
@@ -67,10 +90,37 @@ class Image(SQLModel, table=True):
     """
 
     id: int | None = Field(primary_key=True, default=None)
-    content: str
-    recording_id: int = Field(foreign_key="recording.id", ondelete="CASCADE")
+    content_hash: str
+    size: int
+    format: str
+    recording_id: int = Field(foreign_key="recording.id", ondelete="CASCADE", index=True)
+
+    recording: Recording = Relationship(back_populates="images", sa_relationship_kwargs=NO_LAZY_LOAD)
+
+
+class Keypoints(SQLModel, table=True):
+    """Represents the keypoint sequence extracted from a recording, stored as a packed array.
+
+    Attributes:
+        id (int | None): The primary key of the keypoint sequence. Defaults to None.
+        recording_id (int): The foreign key referencing the associated recording, one sequence per recording.
+                            This field is set to cascade on delete.
+        data (bytes): The raw C-ordered array bytes of the sequence.
+        dtype (str): The NumPy dtype of the packed array, float32 or float16.
+        frames (int): The number of frames in the sequence.
+        features (int): The number of keypoint features per frame.
+        recording (Recording): The relationship to the Recording model,
+                               back-populated by the "keypoints" attribute.
+    """
+
+    id: int | None = Field(primary_key=True, default=None)
+    recording_id: int = Field(foreign_key="recording.id", ondelete="CASCADE", unique=True)
+    data: bytes
+    dtype: str
+    frames: int
+    features: int
 
-    recording: Recording = Relationship(back_populates="images")
+    recording: Recording = Relationship(back_populates="keypoints", sa_relationship_kwargs=NO_LAZY_LOAD)
 
 
 class UserCreate(SQLModel):
@@ -114,6 +164,94 @@ class UserRead(SQLModel):
     hashed_password: str
 
 
+class RecordingRead(SQLModel):
+    """RecordingRead model representing the metadata of a recording.
+
+    Attributes:
+        id (int): Unique identifier for the recording.
+        user_id (int): The ID of the user who created the recording.
+        created_at (datetime.datetime): The timestamp when the recording was created.
+        prediction (str | None): The predicted translation of the recording.
+        feedback (int | None): The feedback score for the recording.
+    """
+
+    id: int
+    user_id: int
+    created_at: datetime.datetime
+    prediction: str | None
+    feedback: int | None
+
+
+class UserReadWithRecordings(UserRead):
+    """UserReadWithRecordings model representing a user together with their recordings.
+
+    Attributes:
+        recordings (list[RecordingRead] | None): The recordings of the user, None if they were not requested.
+    """
+
+    recordings: list[RecordingRead] | None = None
+
+
+class ImageRead(SQLModel):
+    """ImageRead model representing the metadata of an image, without its content.
+
+    Attributes:
+        id (int): Unique identifier for the image.
+        content_hash (str): The SHA-256 hex digest of the image bytes.
+        size (int): The size of the encoded image in bytes.
+        format (str): The image format, "jpeg" or "png".
+        recording_id (int): The ID of the recording the image belongs to.
+    """
+
+    id: int
+    content_hash: str
+    size: int
+    format: str
+    recording_id: int
+
+
+class ImageUpdate(SQLModel):
+    """ImageUpdate is a data model for updating an existing image.
+
+    The content hash, size and format describe the stored frame and are only ever set by the frame store.
+
+    Attributes:
+        recording_id (int): The ID of the recording the image belongs to.
+    """
+
+    recording_id: int | None = None
+
+
+class KeypointsRead(SQLModel):
+    """KeypointsRead model representing the shape of a stored keypoint sequence, without its data.
+
+    Attributes:
+        id (int): Unique identifier for the keypoint sequence.
+        recording_id (int): The ID of the recording the sequence was extracted from.
+        dtype (str): The NumPy dtype of the packed array.
+        frames (int): The number of frames in the sequence.
+        features (int): The number of keypoint features per frame.
+    """
+
+    id: int
+    recording_id: int
+    dtype: str
+    frames: int
+    features: int
+
+
+class RecordingReadWithRelations(RecordingRead):
+    """RecordingReadWithRelations model representing a recording with its requested relations.
+
+    Attributes:
+        images (list[ImageRead] | None): The images of the recording, None if they were not requested.
+        keypoints (KeypointsRead | None): The keypoint sequence metadata, None if not requested or not stored.
+    """
+
+    images: list[ImageRead] | None = None
+    keypoints: KeypointsRead | None = None
+
+
 class UserUpdate(SQLModel):
     """UserUpdate is a data model for updating an existing user.
 
@@ -135,3 +273,27 @@ class UserUpdate(SQLModel):
     def hashed_password(self) -> str:
         """Returns the hashed password."""
         return hash_password(self.password)
+
+
+class UserBulkUpdate(UserUpdate):
+    """UserBulkUpdate is a data model for one row of a bulk user update.
+
+    Attributes:
+        id (int): The ID of the user to update.
+    """
+
+    id: int
+
+
+class UserBulkUpdateResult(SQLModel):
+    """UserBulkUpdateResult model representing the outcome of one row of a bulk user update.
+
+    Attributes:
+        id (int): The ID of the user the row targeted.
+        status (str): "updated", or "not_found" if no user has the ID.
+        user (UserRead | None): The updated user data, None if the user was not found.
+    """
+
+    id: int
+    status: str
+    user: UserRead | None = None
@@ -0,0 +1,32 @@
+"""Shared dependencies of the FastAPI routers."""
+
+from http import HTTPStatus
+from typing import Annotated
+
+from fastapi import Depends, HTTPException
+from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.db import get_session
+from backend.src.db_models import UserRead
+from backend.src.services.auth_service import auth_service
+
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
+
+
+async def get_current_user(
+    session: Annotated[AsyncSession, Depends(get_session)], token: Annotated[str, Depends(oauth2_scheme)]
+) -> UserRead:
+    """Return the user authenticated by the bearer access token of the request.
+
+    Raises:
+        HTTPException: If the token is missing, invalid or expired, or the user is gone or inactive.
+    """
+    user = await auth_service.authenticate_token(session, token)
+    if user is None:
+        raise HTTPException(
+            status_code=HTTPStatus.UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
@@ -0,0 +1,46 @@
+"""Command line export of the recordings dataset into fixed-size shard files.
+
+Example:
+    python -m backend.src.export exports/ --content keypoints --format h5
+
+Running the same command again resumes after the last shard already in the directory.
+"""
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+
+from backend.src.db import async_session
+from backend.src.services.export_service import EXPORT_CONTENTS, EXPORT_FORMATS, export_service
+
+logger = logging.getLogger(__name__)
+
+
+async def export(directory: Path, content: str, fmt: str, after_id: int | None, shard_size: int | None) -> None:
+    """Export the recordings into shard files in a directory."""
+    async with async_session() as session:
+        paths = await export_service.export(
+            session, directory, content=content, fmt=fmt, after_id=after_id, shard_size=shard_size
+        )
+    logger.info("Exported %d shards to %s", len(paths), directory)
+
+
+def main() -> None:
+    """Parse the command line arguments and run the export."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("directory", type=Path, help="The directory of the shard files.")
+    parser.add_argument("--content", choices=EXPORT_CONTENTS, default="keypoints", help="What to export per recording.")
+    parser.add_argument("--format", dest="fmt", choices=EXPORT_FORMATS, default="h5", help="The shard file format.")
+    parser.add_argument(
+        "--after-id", type=int, default=None, help="Export recordings after this id instead of resuming."
+    )
+    parser.add_argument("--shard-size", type=int, default=None, help="The number of recordings per shard.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(export(args.directory, args.content, args.fmt, args.after_id, args.shard_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Conditional GET support for the read endpoints."""
+
+import hashlib
+
+from fastapi import Response, status
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+def weak_etag(value: object) -> str:
+    """Return a weak ETag of a response value, hashed from the representation of its plain data.
+
+    Args:
+        value (object): The data the response is built from, e.g. a `model_dump()` of the response model.
+
+    Returns:
+        str: The weak entity tag, e.g. `W/"5d41402abc4b2a76"`.
+    """
+    return f'W/"{hashlib.blake2b(repr(value).encode(), digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag, using the weak comparison of RFC 9110."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def conditional_response(
+    response: Response, etag: str, if_none_match: str | None, cache_control: str = REVALIDATE_CACHE_CONTROL
+) -> Response | None:
+    """Tag a response with its ETag, returning a 304 Not Modified response if the client has it already.
+
+    Args:
+        response (Response): The response of the endpoint, whose headers are set.
+        etag (str): The entity tag of the response body.
+        if_none_match (str | None): The If-None-Match header of the request.
+        cache_control (str): The Cache-Control header of the response.
+
+    Returns:
+        Response | None: The 304 response to return instead of the body, None if the body has to be sent.
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
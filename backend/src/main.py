@@ -1,19 +1,34 @@
 """Main module for fastapi backend application."""
 
-from fastapi import FastAPI
+import asyncio
+import logging
+from http import HTTPStatus
+
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
-from backend.src.db import init_db
+from backend.src.db import init_db, pool_stats
+from backend.src.models import backend_settings
 from backend.src.routers.auth_router import auth_router
+from backend.src.routers.export_router import export_router
 from backend.src.routers.image_router import image_router
+from backend.src.routers.keypoint_router import keypoint_router
 from backend.src.routers.recording_router import recording_router
 from backend.src.routers.translation_router import translation_router
 from backend.src.routers.user_router import user_router
+from backend.src.services.inference_batcher import inference_batcher
+from backend.src.services.persistence_queue import persistence_queue
+from backend.src.services.tranlsation_service import translation_service
+from backend.src.services.translation_executor import translation_executor
+
+logger = logging.getLogger(__name__)
 
 app = FastAPI()
 app.include_router(user_router, tags=["User"])
 app.include_router(recording_router, tags=["Recording"])
 app.include_router(image_router, tags=["Image"])
+app.include_router(keypoint_router, tags=["Keypoints"])
+app.include_router(export_router, tags=["Export"])
 app.include_router(translation_router, tags=["Translation"])
 app.include_router(auth_router, tags=["Authentication"], prefix="/auth")
 
@@ -32,7 +47,48 @@ def read_root() -> dict[str, str]:
     return {"message": "Hello World"}
 
 
+@app.get("/ready")
+def read_ready() -> dict[str, str]:
+    """Readiness endpoint, not ready until the translation pipeline is loaded and warmed up."""
+    if not (translation_service.ready and translation_executor.ready):
+        raise HTTPException(status_code=HTTPStatus.SERVICE_UNAVAILABLE, detail="Translation pipeline is warming up")
+    return {"status": "ready"}
+
+
+@app.get("/db/pool")
+def read_db_pool() -> dict:
+    """Connection pool statistics, to size the pool for the number of workers."""
+    return pool_stats()
+
+
+async def warm_up_translation_pipeline() -> None:
+    """Load and warm up MediaPipe and the classifier, then start the extraction worker processes."""
+    try:
+        await asyncio.to_thread(translation_service.load)
+        await translation_executor.start()
+    except Exception:
+        logger.exception("Failed to warm up the translation pipeline")
+
+
 @app.on_event("startup")
 async def startup_event() -> None:
-    """Startup event to initialize the database."""
+    """Startup event to initialize the database and start warming up the translation pipeline.
+
+    The models are loaded in the background, so the application serves requests right away and
+    reports readiness on `/ready` once the warm-up finished.
+    """
     await init_db()
+    await inference_batcher.start()
+    if backend_settings.write_behind:
+        await persistence_queue.start()
+    app.state.warm_up = asyncio.create_task(warm_up_translation_pipeline())
+
+
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """Shutdown event to stop the translation pipeline and flush pending writes."""
+    app.state.warm_up.cancel()
+    await persistence_queue.stop()
+    await inference_batcher.stop()
+    await translation_executor.stop()
+    translation_service.close()
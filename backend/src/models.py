@@ -10,6 +10,37 @@ class BackendSettings(BaseSettings):
     secret_key: str
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 15
+    model_path: str = "backend/model.h5"
+    inference_backend: str = "keras"
+    tflite_quantization: str = "float32"
+    tflite_threads: int | None = None
+    batch_max_size: int = 8
+    batch_max_wait_ms: float = 5.0
+    batch_max_queue_size: int = 64
+    translation_workers: int = 0
+    holistic_pool_size: int = 2
+    holistic_pool_timeout_s: float | None = 30.0
+    decode_workers: int = 4
+    decode_prefetch: int = 8
+    stream_frame_timeout_s: float = 10.0
+    live_stride: int = 5
+    live_threshold: float = 0.8
+    live_smoothing: float = 0.5
+    live_max_connections: int = 2
+    keypoint_storage_dtype: str = "float32"
+    frame_store_root: str = "frames"
+    write_behind: bool = False
+    write_behind_queue_size: int = 256
+    write_behind_batch_size: int = 32
+    prediction_cache_size: int = 256
+    prediction_cache_ttl_s: float = 300.0
+    export_shard_size: int = 256
+    export_fetch_size: int = 64
+    password_hash_workers: int = 2
+    token_cache_size: int = 1024
+    token_cache_ttl_s: float = 60.0
+    user_cache_size: int = 1024
+    user_cache_ttl_s: float = 60.0
 
 class TranslateRequest(BaseModel):
     """Pydantic model for the translation request body."""
@@ -0,0 +1,109 @@
+"""Keyset pagination of the list endpoints."""
+
+import base64
+import binascii
+import datetime
+import json
+from collections.abc import Sequence
+from typing import Any
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from sqlalchemy import ColumnElement, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import SQLModel
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+class Page(BaseModel):
+    """A page of a list endpoint.
+
+    Attributes:
+        items (list[dict[str, Any]]): The rows of the page, holding only the requested fields.
+        next_cursor (str | None): The cursor of the next page, None on the last page.
+    """
+
+    items: list[dict[str, Any]]
+    next_cursor: str | None = None
+
+
+def encode_cursor(order_by: str, values: Sequence[Any]) -> str:
+    """Encode the sort key of the last row of a page into an opaque cursor."""
+    payload = json.dumps([order_by, list(values)], default=datetime.datetime.isoformat).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+def decode_cursor(cursor: str, order_by: str, key_columns: Sequence[ColumnElement]) -> list[Any]:
+    """Decode a cursor into the sort key values the next page starts after.
+
+    Raises:
+        HTTPException: If the cursor is malformed or was issued for a different ordering.
+    """
+    invalid = HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    try:
+        cursor_order_by, values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise invalid from e
+    if cursor_order_by != order_by or not isinstance(values, list) or len(values) != len(key_columns):
+        raise invalid
+    try:
+        return [
+            TypeAdapter(column.type.python_type).validate_python(value)
+            for column, value in zip(key_columns, values, strict=True)
+        ]
+    except (TypeError, ValueError, ValidationError) as e:
+        raise invalid from e
+
+
+async def paginate(  # noqa: PLR0913
+    session: AsyncSession,
+    model: type[SQLModel],
+    *,
+    where: Sequence[ColumnElement[bool]] = (),
+    order_by: str = "id",
+    cursor: str | None = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    fields: Sequence[str] | None = None,
+) -> Page:
+    """Return one page of a table, ordered by a column with the id as the tie breaker.
+
+    The page starts after the row the cursor points to (`WHERE (order_by, id) > cursor`), so every
+    page is an index range scan no matter how deep into the table it is. Only the requested fields
+    are selected.
+
+    Args:
+        session (AsyncSession): The database session.
+        model (type[SQLModel]): The table model to page through.
+        where (Sequence[ColumnElement[bool]]): The filters of the rows.
+        order_by (str): The column to order by, "id" or a column whose ties are broken by the id.
+        cursor (str | None): The cursor returned with the previous page, None for the first page.
+        limit (int): The maximum number of rows of the page.
+        fields (Sequence[str] | None): The fields to return, None for all columns.
+
+    Returns:
+        Page: The rows of the page and the cursor of the next one.
+
+    Raises:
+        HTTPException: If a field or the cursor is invalid.
+    """
+    table_columns = [column.name for column in model.__table__.columns]
+    selected = list(fields) if fields else table_columns
+    unknown = set(selected) - set(table_columns)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+
+    keys = ["id"] if order_by == "id" else [order_by, "id"]
+    key_columns = [getattr(model, key) for key in keys]
+    statement = select(*(getattr(model, column) for column in dict.fromkeys([*selected, *keys]))).where(*where)
+    if cursor:
+        after = decode_cursor(cursor, order_by, key_columns)
+        statement = statement.where(tuple_(*key_columns) > tuple_(*after))
+    statement = statement.order_by(*key_columns).limit(limit + 1)
+
+    rows = (await session.execute(statement)).mappings().all()
+    next_cursor = encode_cursor(order_by, [rows[limit - 1][key] for key in keys]) if len(rows) > limit else None
+    return Page(items=[{field: row[field] for field in selected} for row in rows[:limit]], next_cursor=next_cursor)
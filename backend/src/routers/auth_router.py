@@ -5,20 +5,19 @@ from http import HTTPStatus
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.src.db import get_session
-from backend.src.db_models import User
+from backend.src.db_models import User, UserRead
+from backend.src.dependencies import get_current_user
 from backend.src.models import LoginResponse, RegisterRequest
-from backend.src.services.auth_service import AuthService
+from backend.src.services.auth_service import auth_service
+from backend.src.services.user_cache import user_cache
 
 auth_router = APIRouter()
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
-
-auth_service = AuthService()
-
 
 @auth_router.post("/login")
 async def login(
@@ -29,7 +28,7 @@ async def login(
     if not user:
         raise HTTPException(status_code=HTTPStatus.UNAUTHORIZED, detail="Incorrect username or password")
 
-    if not auth_service.verify_password(form_data.password, user.hashed_password):
+    if not await auth_service.verify_password(form_data.password, user.hashed_password):
         raise HTTPException(status_code=HTTPStatus.UNAUTHORIZED, detail="Incorrect username or password")
 
     # Create short-lived access token
@@ -42,19 +41,37 @@ async def login(
 @auth_router.post("/register")
 async def register(session: Annotated[AsyncSession, Depends(get_session)], form_data: RegisterRequest) -> LoginResponse:
     """Register a new user and return an access token."""
-    user = await auth_service.get_user(session, form_data.username, form_data.email)
-    if user:
+    if await auth_service.get_user(session, form_data.username):
         raise HTTPException(status_code=HTTPStatus.CONFLICT, detail="Username already registered")
+    if await auth_service.email_taken(session, form_data.email):
+        raise HTTPException(status_code=HTTPStatus.CONFLICT, detail="Email already registered")
 
-    hashed_password = auth_service.get_password_hash(form_data.password)
+    hashed_password = await auth_service.get_password_hash(form_data.password)
     new_user = User(username=form_data.username, hashed_password=hashed_password, email=form_data.email)
 
     session.add(new_user)
-    await session.commit()
+    try:
+        await session.commit()
+    except IntegrityError as e:
+        # A concurrent registration took the username or email after the checks above.
+        raise HTTPException(status_code=HTTPStatus.CONFLICT, detail="Username or email already registered") from e
     await session.refresh(new_user)
+    user_cache.set(UserRead.model_validate(new_user))
 
     # Create short-lived access token
     access_token_expires = timedelta(minutes=15)
     access_token = auth_service.create_access_token(data={"sub": new_user.username}, expires_delta=access_token_expires)
 
     return LoginResponse(access_token=access_token, is_admin=new_user.is_admin, user_id=new_user.id)
+
+
+@auth_router.get("/me")
+async def read_me(user: Annotated[UserRead, Depends(get_current_user)]) -> UserRead:
+    """Return the user authenticated by the access token."""
+    return user
+
+
+@auth_router.get("/stats")
+def read_stats() -> dict:
+    """Return the hit ratio and size of the token and the user caches."""
+    return auth_service.stats()
@@ -0,0 +1,60 @@
+"""This module contains the dataset export router for the FastAPI application."""
+
+import asyncio
+import io
+from contextlib import aclosing
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, Depends, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.db import get_session
+from backend.src.models import backend_settings
+from backend.src.services.export_service import export_service
+
+MAX_SHARD_SIZE = 1024
+
+export_router = APIRouter()
+
+
+@export_router.get("/export/shard")
+async def export_shard(
+    *,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    after_id: int = 0,
+    shard_size: Annotated[int, Query(ge=1, le=MAX_SHARD_SIZE)] = backend_settings.export_shard_size,
+    content: Literal["keypoints", "frames"] = "keypoints",
+    fmt: Annotated[Literal["h5", "npz"], Query(alias="format")] = "h5",
+) -> Response:
+    """Export the next shard of the recordings dataset.
+
+    Clients page through the whole dataset by passing the `X-Last-Recording-Id` header of a shard as
+    the `after_id` of the next request, until the endpoint answers 204 No Content.
+
+    Args:
+        session (Session): The database session dependency.
+        after_id (int): Only export recordings with a greater id.
+        shard_size (int): The maximum number of recordings in the shard.
+        content (str): Export the "keypoints" or the encoded "frames" of the recordings.
+        fmt (str): The shard format, "h5" or "npz".
+
+    Returns:
+        Response: The shard file, or 204 No Content if there are no recordings after `after_id`.
+    """
+    async with aclosing(
+        export_service.iter_shards(session, content=content, after_id=after_id, shard_size=shard_size)
+    ) as shards:
+        shard = await anext(shards, None)
+    if shard is None:
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    buffer = io.BytesIO()
+    await asyncio.to_thread(export_service.write_shard, shard, buffer, fmt)
+    return Response(
+        content=buffer.getvalue(),
+        media_type="application/octet-stream",
+        headers={
+            "Content-Disposition": f'attachment; filename="{export_service.shard_name(shard, fmt)}"',
+            "X-Last-Recording-Id": str(shard[-1].recording_id),
+        },
+    )
@@ -1,48 +1,69 @@
 """This module contains the image router for the FastAPI application."""
 
+import asyncio
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, File, Form, Header, HTTPException, Query, Response, UploadFile
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from backend.src.db import get_session
-from backend.src.db_models import Image
+from backend.src.db_models import Image, ImageRead, ImageUpdate
+from backend.src.http_cache import IMMUTABLE_CACHE_CONTROL, conditional_response, etag_matches, weak_etag
+from backend.src.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page, paginate
+from backend.src.services.frame_store import frame_store
 
 image_router = APIRouter()
 
 
 @image_router.post("/images/")
-async def create_image(*, session: Annotated[AsyncSession, Depends(get_session)], image: Image) -> Image:
+async def create_image(
+    *,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    recording_id: Annotated[int, Form()],
+    file: Annotated[UploadFile, File()],
+) -> Image:
     """Create a new image entry in the database.
 
-    This endpoint allows for the creation of a new image entry in the database.
-    It accepts an image object, adds it to the session, commits the transaction,
-    and refreshes the image instance to reflect any changes made during the commit.
+    This endpoint stores an uploaded JPEG/PNG file in the frame store and adds an image
+    entry referencing it to the database. It commits the transaction and refreshes the
+    image instance to reflect any changes made during the commit.
 
     Args:
         session (Session): The database session used for the transaction.
-        image (Image): The image object to be added to the database.
+        recording_id (int): The ID of the recording the image belongs to.
+        file (UploadFile): The encoded image to store.
 
     Returns:
         Image: The newly created image object with updated information from the database.
     """
+    stored = await asyncio.to_thread(frame_store.put, await file.read())
+    image = Image(recording_id=recording_id, **stored.model_dump())
     session.add(image)
     await session.commit()
     await session.refresh(image)
     return image
 
 
-@image_router.get("/images/{image_id}")
-async def read_image(*, session: Annotated[AsyncSession, Depends(get_session)], image_id: int) -> Image:
-    """Retrieve an image by its ID.
+@image_router.get("/images/{image_id}", response_model=ImageRead)
+async def read_image(
+    *,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    response: Response,
+    image_id: int,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> ImageRead | Response:
+    """Retrieve the metadata of an image by its ID.
 
     Args:
         session (Session): The database session dependency.
+        response (Response): The response, tagged with the ETag of the image metadata.
         image_id (int): The ID of the image to retrieve.
+        if_none_match (str | None): The ETags of the image metadata the client already has.
 
     Returns:
-        Image: The image object if found.
+        ImageRead: The image metadata if found, or a 304 response if the client has it already.
 
     Raises:
         HTTPException: If the image is not found, raises a 404 HTTP exception.
@@ -50,35 +71,88 @@ async def read_image(*, session: Annotated[AsyncSession, Depends(get_session)],
     image = await session.get(Image, image_id)
     if not image:
         raise HTTPException(status_code=404, detail="Image not found")
-    return image
+    image = ImageRead.model_validate(image)
+    return conditional_response(response, weak_etag(image.model_dump()), if_none_match) or image
 
 
-@image_router.get("/images/")
-async def read_images(*, session: Annotated[AsyncSession, Depends(get_session)]) -> list[Image]:
-    """Endpoint to retrieve a list of images.
+@image_router.get("/images/{image_id}/content")
+async def read_image_content(
+    *,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    image_id: int,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    """Stream the encoded bytes of an image from the frame store.
 
-    This endpoint retrieves all images from the database using the provided session.
+    Only the content hash and format are read from the database, the bytes never pass through the ORM.
+    Frames never change once stored, so the content hash is a strong ETag, the response may be cached
+    forever and a request that already has the frame gets 304 Not Modified without touching the store.
 
     Args:
         session (Session): The database session dependency.
+        image_id (int): The ID of the image to stream.
+        if_none_match (str | None): The ETags of the image content the client already has.
 
     Returns:
-        list[Image]: A list of Image objects retrieved from the database.
+        Response: The JPEG/PNG bytes of the image, or a 304 response.
+
+    Raises:
+        HTTPException: If the image or its content is not found, raises a 404 HTTP exception.
     """
-    images = await session.execute(select(Image))
-    return images.scalars().all()
+    result = await session.execute(select(Image.content_hash, Image.format).where(Image.id == image_id))
+    row = result.first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Image not found")
+    headers = {"ETag": f'"{row.content_hash}"', "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    try:
+        chunks = await asyncio.to_thread(frame_store.stream, row.content_hash)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail="Image content not found") from e
+    return StreamingResponse(chunks, media_type=f"image/{row.format}", headers=headers)
+
+
+@image_router.get("/images/")
+async def read_images(
+    *,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    fields: Annotated[list[str] | None, Query()] = None,
+    recording_id: int | None = None,
+) -> Page:
+    """Endpoint to retrieve a page of images ordered by ID.
+
+    Only image metadata is returned, the content of an image is served by `/images/{image_id}/content`.
+
+    Args:
+        session (Session): The database session dependency.
+        cursor (str | None): The cursor of the page, as returned with the previous page.
+        limit (int): The maximum number of images of the page.
+        fields (list[str] | None): The image fields to return, all of them if not given.
+        recording_id (int | None): Only return images of this recording.
+
+    Returns:
+        Page: The images of the page and the cursor of the next one.
+    """
+    where = [Image.recording_id == recording_id] if recording_id is not None else []
+    return await paginate(session, Image, where=where, cursor=cursor, limit=limit, fields=fields)
 
 
 @image_router.put("/images/{image_id}")
-async def update_image(*, session: Annotated[AsyncSession, Depends(get_session)], image_id: int, image: Image) -> Image:
+async def update_image(
+    *, session: Annotated[AsyncSession, Depends(get_session)], image_id: int, image: ImageUpdate
+) -> Image:
     """Update an existing image.
 
-    This endpoint updates the details of an existing image in the database.
+    This endpoint updates the details of an existing image in the database. The reference to the stored
+    frame cannot be changed, new content is uploaded as a new image.
 
     Args:
         session (Session): The database session dependency.
         image_id (int): The ID of the image to update.
-        image (Image): The new image data to update.
+        image (ImageUpdate): The new image data to update.
 
     Returns:
         Image: The updated image object.
@@ -101,6 +175,8 @@ async def update_image(*, session: Annotated[AsyncSession, Depends(get_session)]
 async def delete_image(*, session: Annotated[AsyncSession, Depends(get_session)], image_id: int) -> Image:
     """Delete an image by its ID.
 
+    The content stays in the frame store, since identical frames of other images share it.
+
     Args:
         session (Session): The database session dependency.
         image_id (int): The ID of the image to delete.
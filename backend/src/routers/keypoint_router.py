@@ -0,0 +1,41 @@
+"""This module contains the keypoint router for the FastAPI application."""
+
+import io
+from typing import Annotated
+
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.db import get_session
+from backend.src.services.keypoint_service import keypoint_service
+
+keypoint_router = APIRouter()
+
+
+@keypoint_router.get("/keypoints/")
+async def read_keypoints(
+    *, session: Annotated[AsyncSession, Depends(get_session)], recording_ids: Annotated[list[int], Query()]
+) -> Response:
+    """Retrieve the keypoint sequences of many recordings as one stacked NumPy array.
+
+    Args:
+        session (Session): The database session dependency.
+        recording_ids (list[int]): The IDs of the recordings, in the order of the stacked array.
+
+    Returns:
+        Response: A `.npy` file with a float32 array of shape (len(recording_ids), frames, 1662).
+
+    Raises:
+        HTTPException: If a recording has no keypoints (404) or the sequences can not be stacked (422).
+    """
+    try:
+        stacked = await keypoint_service.load(session, recording_ids)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=f"Keypoints not found for recordings {e.args[0]}") from e
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+    buffer = io.BytesIO()
+    np.save(buffer, stacked, allow_pickle=False)
+    return Response(content=buffer.getvalue(), media_type="application/octet-stream")
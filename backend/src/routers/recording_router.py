@@ -1,13 +1,23 @@
 """This module contains the recording router for the FastAPI application."""
 
-from typing import Annotated
+import datetime
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select
+from sqlalchemy.orm import joinedload, selectinload
 
 from backend.src.db import get_session
-from backend.src.db_models import Recording
+from backend.src.db_models import (
+    ImageRead,
+    Keypoints,
+    KeypointsRead,
+    Recording,
+    RecordingRead,
+    RecordingReadWithRelations,
+)
+from backend.src.http_cache import conditional_response, weak_etag
+from backend.src.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page, paginate
 
 recording_router = APIRouter()
 
@@ -34,40 +44,98 @@ async def create_recording(
     return recording
 
 
-@recording_router.get("/recordings/{recording_id}")
-async def read_recording(*, session: Annotated[AsyncSession, Depends(get_session)], recording_id: int) -> Recording:
+@recording_router.get("/recordings/{recording_id}", response_model=RecordingReadWithRelations)
+async def read_recording(
+    *,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    response: Response,
+    recording_id: int,
+    include: Annotated[list[Literal["images", "keypoints"]] | None, Query()] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> RecordingReadWithRelations | Response:
     """Endpoint to retrieve a recording by its ID.
 
+    Relations are only loaded when requested: the images with one extra SELECT ... IN query and the
+    keypoint sequence joined to the recording, without its packed data.
+
+    The response is tagged with a weak ETag, so a client revalidating it after a change of the
+    feedback or the relations gets the new body and otherwise an empty 304 Not Modified response.
+
     Args:
         session (Session): The database session dependency.
+        response (Response): The response, tagged with the ETag of the recording.
         recording_id (int): The ID of the recording to retrieve.
+        include (list[str] | None): The relations to return with the recording, "images" and/or "keypoints".
+        if_none_match (str | None): The ETags of the recording the client already has.
 
     Returns:
-        Recording: The recording object if found.
+        RecordingReadWithRelations: The recording metadata and the requested relations if found, or a 304 response.
 
     Raises:
         HTTPException: If the recording is not found, raises a 404 HTTP exception.
     """
-    recording = await session.get(Recording, recording_id)
+    include = set(include or [])
+    options = []
+    if "images" in include:
+        options.append(selectinload(Recording.images))
+    if "keypoints" in include:
+        options.append(joinedload(Recording.keypoints).defer(Keypoints.data))
+    recording = await session.get(Recording, recording_id, options=options)
     if not recording:
         raise HTTPException(status_code=404, detail="Recording not found")
-    return recording
+    recording_read = RecordingReadWithRelations(
+        **RecordingRead.model_validate(recording).model_dump(),
+        images=[ImageRead.model_validate(image) for image in recording.images] if "images" in include else None,
+        keypoints=KeypointsRead.model_validate(recording.keypoints)
+        if "keypoints" in include and recording.keypoints
+        else None,
+    )
+    return conditional_response(response, weak_etag(recording_read.model_dump()), if_none_match) or recording_read
 
 
 @recording_router.get("/recordings/")
-async def read_recordings(*, session: Annotated[AsyncSession, Depends(get_session)]) -> list[Recording]:
-    """Endpoint to retrieve a list of recordings.
-
-    This endpoint retrieves all recordings from the database using the provided session.
+async def read_recordings(  # noqa: PLR0913
+    *,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    order_by: Literal["id", "created_at"] = "id",
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    fields: Annotated[list[str] | None, Query()] = None,
+    user_id: int | None = None,
+    created_from: datetime.datetime | None = None,
+    created_to: datetime.datetime | None = None,
+    prediction: str | None = None,
+    feedback: int | None = None,
+) -> Page:
+    """Endpoint to retrieve a page of recordings.
 
     Args:
         session (Session): The database session dependency.
+        order_by (str): Order the recordings by "id" or by "created_at".
+        cursor (str | None): The cursor of the page, as returned with the previous page.
+        limit (int): The maximum number of recordings of the page.
+        fields (list[str] | None): The recording fields to return, all of them if not given.
+        user_id (int | None): Only return recordings of this user.
+        created_from (datetime.datetime | None): Only return recordings created at or after this time.
+        created_to (datetime.datetime | None): Only return recordings created before this time.
+        prediction (str | None): Only return recordings with this prediction.
+        feedback (int | None): Only return recordings with this feedback.
 
     Returns:
-        list[Recording]: A list of all recordings in the database.
+        Page: The recordings of the page and the cursor of the next one.
     """
-    recordings = await session.execute(select(Recording))
-    return recordings.scalars().all()
+    where = []
+    if user_id is not None:
+        where.append(Recording.user_id == user_id)
+    if created_from is not None:
+        where.append(Recording.created_at >= created_from)
+    if created_to is not None:
+        where.append(Recording.created_at < created_to)
+    if prediction is not None:
+        where.append(Recording.prediction == prediction)
+    if feedback is not None:
+        where.append(Recording.feedback == feedback)
+    return await paginate(session, Recording, where=where, order_by=order_by, cursor=cursor, limit=limit, fields=fields)
 
 
 @recording_router.put("/recordings/{recording_id}")
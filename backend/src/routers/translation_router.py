@@ -1,46 +1,222 @@
 """This module contains the image router for the FastAPI application."""
 
+import asyncio
+from contextlib import ExitStack
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+import numpy as np
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, WebSocket, WebSocketDisconnect, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.src.db import get_session
-from backend.src.db_models import Image, Recording
-from backend.src.models import FeedbackRequest, TranslateRequest
+from backend.src.db_models import Recording
+from backend.src.models import FeedbackRequest, TranslateRequest, backend_settings
+from backend.src.services.frame_store import StoredFrame, frame_store
+from backend.src.services.inference_batcher import inference_batcher
+from backend.src.services.keypoints import allocate_sequence
+from backend.src.services.live_recognizer import LiveRecognizer
+from backend.src.services.persistence_queue import persistence_queue
+from backend.src.services.prediction_cache import prediction_cache
+from backend.src.services.recording_service import recording_service
 from backend.src.services.tranlsation_service import translation_service
+from backend.src.services.translation_executor import translation_executor
+from backend.src.utils import decode_data_url
 
 translation_router = APIRouter()
 
 
-async def add_recording(user_id: int, session: AsyncSession) -> Recording:
-    """Add a recording to the database."""
-    recording = Recording(user_id=user_id)
-    session.add(recording)
-    await session.commit()
-    await session.refresh(recording)
-    return recording
-
-
-async def add_images(recording_id: int, images: list[str], session: AsyncSession) -> None:
-    """Add images to database."""
-    for img in images:
-        session.add(Image(recording_id=recording_id, content=img))
-    await session.commit()
-
-
-@translation_router.post("/translate")
+def require_ready() -> None:
+    """Reject translations while the models are still loading."""
+    if not translation_service.ready:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Translation pipeline is warming up"
+        )
+
+
+async def accept_when_ready(websocket: WebSocket) -> bool:
+    """Accept a WebSocket, closing it right away while the models are still loading."""
+    await websocket.accept()
+    if not translation_service.ready:
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER, reason="Translation pipeline is warming up")
+        return False
+    return True
+
+
+async def save_recording(  # noqa: PLR0913
+    session: AsyncSession,
+    user_id: int,
+    frames: list[bytes],
+    keypoints: np.ndarray | None,
+    prediction: str,
+    images: list[StoredFrame] | None = None,
+) -> int:
+    """Store a translated recording, returning its id.
+
+    In write-behind mode only the recording row is written before returning, its frames and
+    keypoints are handed to the persistence queue. Otherwise the frames are put into the frame
+    store, unless the caller already did and passes their references as `images`.
+    """
+    if persistence_queue.running:
+        recording_id = await recording_service.add_recording(session, user_id, prediction)
+        await session.commit()
+        await persistence_queue.put(recording_id, frames, keypoints)
+        return recording_id
+
+    if images is None:
+        images = await asyncio.to_thread(frame_store.put_many, frames)
+    return await recording_service.save_translation(session, user_id, images, keypoints, prediction)
+
+
+async def predict_frames(frames: list[bytes]) -> tuple[str, np.ndarray]:
+    """Predict the sign of the frames of a recording, returning the prediction and the keypoints.
+
+    Byte-identical submissions are answered from the prediction cache, which also holds their keypoints.
+    """
+    model_version = translation_service.model_version
+    cache_key = await asyncio.to_thread(prediction_cache.key, frames)
+    cached = prediction_cache.get(model_version, cache_key)
+    if cached is not None:
+        prediction, keypoints = cached
+    else:
+        try:
+            keypoints = await translation_executor.extract_keypoints(frames)
+        except TimeoutError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="No MediaPipe graph became available"
+            ) from e
+        prediction = translation_service.label(await inference_batcher.predict(keypoints))
+        prediction_cache.set(model_version, cache_key, prediction, keypoints)
+    return prediction, keypoints
+
+
+async def run_translation(user_id: int, frames: list[bytes], session: AsyncSession) -> dict:
+    """Translate the frames of a recording and store it with its images, keypoints and prediction."""
+    images = None
+    if persistence_queue.running:
+        prediction, keypoints = await predict_frames(frames)
+    else:
+        # The frames are written to the frame store while their keypoints are extracted.
+        images, (prediction, keypoints) = await asyncio.gather(
+            asyncio.to_thread(frame_store.put_many, frames), predict_frames(frames)
+        )
+    recording_id = await save_recording(session, user_id, frames, keypoints, prediction, images)
+
+    return {"prediction": prediction, "recording_id": recording_id}
+
+
+@translation_router.post("/translate", dependencies=[Depends(require_ready)])
 async def translate(data: TranslateRequest, session: Annotated[AsyncSession, Depends(get_session)]) -> dict:
     """Upload frames and return a prediction."""
-    recording = await add_recording(data.user_id, session)
-    await add_images(recording.id, data.frames, session)
-
-    prediction = translation_service.process_frames(data.frames)
-    recording = await session.get(Recording, recording.id)
-    recording.prediction = prediction
-    await session.commit()
-
-    return {"prediction": prediction, "recording_id": recording.id}
+    frames = await asyncio.to_thread(lambda: [decode_data_url(frame) for frame in data.frames])
+    return await run_translation(data.user_id, frames, session)
+
+
+@translation_router.post("/translate/binary", dependencies=[Depends(require_ready)])
+async def translate_binary(
+    user_id: Annotated[int, Form()],
+    frames: Annotated[list[UploadFile], File()],
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> dict:
+    """Upload frames as raw JPEG/PNG multipart parts and return a prediction."""
+    return await run_translation(user_id, [await frame.read() for frame in frames], session)
+
+
+@translation_router.websocket("/translate/stream")
+async def translate_stream(websocket: WebSocket, session: Annotated[AsyncSession, Depends(get_session)]) -> None:
+    """Translate frames streamed over a WebSocket while they are being captured.
+
+    A recording starts with a JSON text message `{"user_id": ...}` followed by one binary message
+    with the raw JPEG/PNG bytes per frame. Landmarks are extracted as each frame arrives, so once the
+    last frame is in only the classifier predict remains. The result is sent back as
+    `{"prediction": ..., "recording_id": ...}` and another recording can follow on the same connection.
+    Extraction always runs in the API process, on a MediaPipe graph checked out per recording. A
+    recording whose next frame does not arrive within `stream_frame_timeout_s` closes the connection
+    and releases the graph, and so does a recording for which no graph becomes available (1013).
+    """
+    if not await accept_when_ready(websocket):
+        return
+    try:
+        while True:
+            start = await websocket.receive_json()
+            try:
+                user_id = int(start["user_id"])
+            except (KeyError, TypeError, ValueError):
+                await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Expected {'user_id': int}")
+                return
+
+            sequence = allocate_sequence()
+            raw_frames = []
+            graph = ExitStack()
+            try:
+                holistic = await asyncio.to_thread(graph.enter_context, translation_service.holistic_pool.checkout())
+            except TimeoutError:
+                await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER, reason="No MediaPipe graph available")
+                return
+            try:
+                for row in sequence:
+                    raw = await asyncio.wait_for(websocket.receive_bytes(), backend_settings.stream_frame_timeout_s)
+                    raw_frames.append(raw)
+                    await asyncio.to_thread(translation_service.extract_frame, raw, holistic, row)
+            except TimeoutError:
+                await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Timed out waiting for a frame")
+                return
+            finally:
+                await asyncio.to_thread(graph.close)
+
+            prediction = translation_service.label(await inference_batcher.predict(sequence))
+            recording_id = await save_recording(session, user_id, raw_frames, sequence, prediction)
+            await websocket.send_json({"prediction": prediction, "recording_id": recording_id})
+    except WebSocketDisconnect:
+        return
+
+
+@translation_router.websocket("/translate/live")
+async def translate_live(websocket: WebSocket) -> None:
+    """Continuously recognize signs in a live stream of frames sent over a WebSocket.
+
+    Every binary message is one raw JPEG/PNG frame. Keypoints are kept in a fixed-size sliding window
+    and the classifier runs every `live_stride` frames over the last 30 frames. Recognized signs are
+    sent as `{"prediction": ..., "confidence": ...}` once their smoothed confidence passes
+    `live_threshold`. Nothing is persisted in this mode.
+
+    Every connection holds a MediaPipe graph of the live pool while it is open. Once `live_max_connections`
+    connections are open, further ones are closed with 1013 (try again later).
+    """
+    if not await accept_when_ready(websocket):
+        return
+    graph = ExitStack()
+    try:
+        holistic = graph.enter_context(translation_service.live_pool.checkout())
+    except TimeoutError:
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER, reason="Too many live connections")
+        return
+    recognizer = LiveRecognizer(
+        len(translation_service.classes),
+        stride=backend_settings.live_stride,
+        threshold=backend_settings.live_threshold,
+        smoothing=backend_settings.live_smoothing,
+    )
+
+    async def classify(window: np.ndarray) -> None:
+        recognized = recognizer.update(await inference_batcher.predict(window))
+        if recognized:
+            label, confidence = recognized
+            await websocket.send_json({"prediction": translation_service.classes[label], "confidence": confidence})
+
+    pending: asyncio.Task | None = None
+    try:
+        while True:
+            raw = await websocket.receive_bytes()
+            await asyncio.to_thread(translation_service.extract_frame, raw, holistic, recognizer.window.next_row())
+            # Windows that come due while the previous one is still being classified are skipped.
+            if recognizer.push() and (pending is None or pending.done()):
+                pending = asyncio.create_task(classify(recognizer.snapshot()))
+    except WebSocketDisconnect:
+        return
+    finally:
+        if pending is not None:
+            pending.cancel()
+        await asyncio.to_thread(graph.close)
 
 
 @translation_router.post("/feedback")
@@ -53,3 +229,16 @@ async def feedback(data: FeedbackRequest, session: Annotated[AsyncSession, Depen
     # save feedback
 
     return {"message": "Feedback saved."}
+
+
+@translation_router.get("/translate/stats")
+async def translation_stats() -> dict:
+    """Return the translation pipeline statistics."""
+    return {
+        "executor": translation_executor.stats(),
+        "holistic_pool": translation_service.holistic_pool.stats() if translation_service.holistic_pool else None,
+        "live_pool": translation_service.live_pool.stats() if translation_service.live_pool else None,
+        "batcher": inference_batcher.stats(),
+        "persistence_queue": persistence_queue.stats(),
+        "prediction_cache": prediction_cache.stats(),
+    }
@@ -2,12 +2,26 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
 from backend.src.db import get_session
-from backend.src.db_models import User, UserCreate, UserRead, UserUpdate
+from backend.src.db_models import (
+    RecordingRead,
+    User,
+    UserBulkUpdate,
+    UserBulkUpdateResult,
+    UserCreate,
+    UserRead,
+    UserReadWithRecordings,
+    UserUpdate,
+)
+from backend.src.http_cache import conditional_response, weak_etag
+from backend.src.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page, paginate
+from backend.src.services.user_cache import user_cache
 
 user_router = APIRouter()
 
@@ -26,49 +40,95 @@ async def create_user(*, session: Annotated[AsyncSession, Depends(get_session)],
 
     Returns:
         UserRead: The created user data in the response model format.
+
+    Raises:
+        HTTPException: If the username or email is already registered.
     """
     user = User.model_validate(user)
     session.add(user)
-    await session.commit()
+    try:
+        await session.commit()
+    except IntegrityError as e:
+        raise HTTPException(status_code=409, detail="Username or email already registered") from e
     await session.refresh(user)
-    return UserRead.model_validate(user)
+    user = UserRead.model_validate(user)
+    user_cache.set(user)
+    return user
 
 
 @user_router.get("/users/{user_id}")
-async def read_user(*, session: Annotated[AsyncSession, Depends(get_session)], user_id: int) -> UserRead:
+async def read_user(
+    *, session: Annotated[AsyncSession, Depends(get_session)], user_id: int, include_recordings: bool = False
+) -> UserReadWithRecordings:
     """Retrieve a user by their user ID.
 
     Args:
         session (Session): The database session dependency.
         user_id (int): The ID of the user to retrieve.
+        include_recordings (bool): Whether to return the metadata of the user's recordings,
+                                   loaded with one extra SELECT ... IN query.
 
     Returns:
-        UserRead: The user data in the UserRead response model.
+        UserReadWithRecordings: The user data, with their recordings if requested.
 
     Raises:
         HTTPException: If the user with the specified ID is not found.
     """
-    user = await session.get(User, user_id)
+    if not include_recordings and (cached := user_cache.get_by_id(user_id)):
+        return UserReadWithRecordings(**cached.model_dump())
+
+    token = user_cache.fill_token(user_id=user_id)
+    options = [selectinload(User.recordings)] if include_recordings else []
+    user = await session.get(User, user_id, options=options)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return UserRead.model_validate(user)
-
-
-@user_router.get("/users/")
-async def read_users(*, session: Annotated[AsyncSession, Depends(get_session)]) -> list[UserRead]:
-    """Retrieve a list of users.
-
-    This endpoint retrieves all users from the database and returns them as a list
-    of `UserRead` models.
+    user_read = UserRead.model_validate(user)
+    user_cache.fill(user_read, token)
+    return UserReadWithRecordings(
+        **user_read.model_dump(),
+        recordings=[RecordingRead.model_validate(recording) for recording in user.recordings]
+        if include_recordings
+        else None,
+    )
+
+
+@user_router.get("/users/", response_model=Page)
+async def read_users(  # noqa: PLR0913
+    *,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    response: Response,
+    if_none_match: Annotated[str | None, Header()] = None,
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    fields: Annotated[list[str] | None, Query()] = None,
+    is_active: bool | None = None,
+    is_admin: bool | None = None,
+) -> Page | Response:
+    """Retrieve a page of users ordered by ID.
+
+    The page is tagged with a weak ETag, a request whose If-None-Match matches it gets an empty
+    304 Not Modified response.
 
     Parameters:
         session (Session): The database session dependency.
+        response (Response): The response, tagged with the ETag of the page.
+        if_none_match (str | None): The ETags of the page the client already has.
+        cursor (str | None): The cursor of the page, as returned with the previous page.
+        limit (int): The maximum number of users of the page.
+        fields (list[str] | None): The user fields to return, all of them if not given.
+        is_active (bool | None): Only return active or inactive users.
+        is_admin (bool | None): Only return admins or regular users.
 
     Returns:
-        list[UserRead]: A list of users in the `UserRead` model format.
+        Page: The users of the page and the cursor of the next one, or a 304 response.
     """
-    users = await session.execute(select(User))
-    return [UserRead.model_validate(user) for user in users.scalars().all()]
+    where = []
+    if is_active is not None:
+        where.append(User.is_active == is_active)
+    if is_admin is not None:
+        where.append(User.is_admin == is_admin)
+    page = await paginate(session, User, where=where, cursor=cursor, limit=limit, fields=fields)
+    return conditional_response(response, weak_etag(page.model_dump()), if_none_match) or page
 
 
 @user_router.put("/users/{user_id}")
@@ -83,7 +143,7 @@ async def update_user(
         user (UserUpdate): The user update data.
 
     Raises:
-        HTTPException: If the user with the given ID is not found.
+        HTTPException: If the user with the given ID is not found, or the new username or email is taken.
 
     Returns:
         UserRead: The updated user data.
@@ -91,14 +151,68 @@ async def update_user(
     db_user = await session.get(User, user_id)
     if not db_user:
         raise HTTPException(status_code=404, detail="User not found")
+    previous_username = db_user.username
     for key, value in user.model_dump(exclude_unset=True, exclude=["password"]).items():
         setattr(db_user, key, value)
     if user.password:
         db_user.hashed_password = user.hashed_password
     session.add(db_user)
-    await session.commit()
+    try:
+        await session.commit()
+    except IntegrityError as e:
+        raise HTTPException(status_code=409, detail="Username or email already registered") from e
     await session.refresh(db_user)
-    return UserRead.model_validate(db_user)
+    updated = UserRead.model_validate(db_user)
+    user_cache.invalidate(user_id, previous_username)
+    user_cache.set(updated)
+    return updated
+
+
+@user_router.patch("/users/")
+async def update_users(
+    *, session: Annotated[AsyncSession, Depends(get_session)], users: list[UserBulkUpdate]
+) -> list[UserBulkUpdateResult]:
+    """Apply partial updates to many users in one transaction.
+
+    All targeted users are loaded with one SELECT ... WHERE id IN query and the updates are committed
+    together, so either every row is saved or none is.
+
+    Args:
+        session (Session): The database session dependency.
+        users (list[UserBulkUpdate]): The partial updates, each with the ID of the user it applies to.
+
+    Raises:
+        HTTPException: If an update would give a user a username or email that is already taken.
+
+    Returns:
+        list[UserBulkUpdateResult]: The outcome of every update, in the order of the request.
+    """
+    result = await session.execute(select(User).where(User.id.in_({user.id for user in users})))
+    db_users = {db_user.id: db_user for db_user in result.scalars()}
+    previous_usernames = {user_id: db_user.username for user_id, db_user in db_users.items()}
+    for user in users:
+        db_user = db_users.get(user.id)
+        if db_user is None:
+            continue
+        for key, value in user.model_dump(exclude_unset=True, exclude=["id", "password"]).items():
+            setattr(db_user, key, value)
+        if user.password:
+            db_user.hashed_password = user.hashed_password
+    try:
+        await session.commit()
+    except IntegrityError as e:
+        raise HTTPException(status_code=409, detail="Username or email already registered") from e
+
+    updated = {user_id: UserRead.model_validate(db_user) for user_id, db_user in db_users.items()}
+    for user_id, user in updated.items():
+        user_cache.invalidate(user_id, previous_usernames[user_id])
+        user_cache.set(user)
+    return [
+        UserBulkUpdateResult(id=user.id, status="updated", user=updated[user.id])
+        if user.id in updated
+        else UserBulkUpdateResult(id=user.id, status="not_found")
+        for user in users
+    ]
 
 
 @user_router.delete("/users/{user_id}")
@@ -120,4 +234,5 @@ async def delete_user(*, session: Annotated[AsyncSession, Depends(get_session)],
         raise HTTPException(status_code=404, detail="User not found")
     await session.delete(user)
     await session.commit()
+    user_cache.invalidate(user_id, user.username)
     return UserRead.model_validate(user)
@@ -1,15 +1,18 @@
 """A service class to handle authentication-related operations."""
 
-import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 
 import jwt
 from passlib.context import CryptContext
-from sqlalchemy import or_, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.src.db_models import User
+from backend.src.cache import TTLCache
+from backend.src.db_models import User, UserRead
 from backend.src.models import backend_settings
+from backend.src.services.user_cache import user_cache
 
 SECRET_KEY = backend_settings.secret_key
 ALGORITHM = backend_settings.algorithm
@@ -19,23 +22,54 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 class AuthService:
-    """A service class to handle authentication-related operations."""
+    """A service class to handle authentication-related operations.
 
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+    bcrypt is deliberately slow, so hashing and verifying passwords runs on a small dedicated thread
+    pool: a burst of logins queues up there instead of blocking the event loop, and at most
+    `hash_workers` CPU cores are spent on it.
+
+    The claims of verified access tokens are cached, so authenticated requests skip the signature
+    check until the entry expires or the token does, and users are looked up through the user cache.
+    """
+
+    def __init__(self, hash_workers: int, token_cache_size: int, token_cache_ttl_seconds: float) -> None:
+        """Initialize the service.
+
+        Args:
+            hash_workers (int): The maximum number of concurrent bcrypt operations.
+            token_cache_size (int): The maximum number of cached verified tokens, 0 disables the cache.
+            token_cache_ttl_seconds (float): How long a verified token stays cached.
+        """
+        self._hash_executor = ThreadPoolExecutor(max_workers=hash_workers, thread_name_prefix="bcrypt")
+        self.token_cache: TTLCache[str, dict] = TTLCache(token_cache_size, token_cache_ttl_seconds)
+
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify a plain-text password against the stored hashed password."""
-        return pwd_context.verify(plain_password, hashed_password)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._hash_executor, pwd_context.verify, plain_password, hashed_password)
 
-    def get_password_hash(self, password: str) -> str:
+    async def get_password_hash(self, password: str) -> str:
         """Hash a plain-text password."""
-        return pwd_context.hash(password)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._hash_executor, pwd_context.hash, password)
+
+    async def get_user(self, session: AsyncSession, username: str) -> UserRead | None:
+        """Fetch a user by username from the user cache or the database, an exact match on the unique username index."""
+        user = user_cache.get_by_username(username)
+        if user is None:
+            token = user_cache.fill_token(username=username)
+            result = await session.execute(select(User).where(User.username == username))
+            db_user = result.scalars().first()
+            if db_user is None:
+                return None
+            user = UserRead.model_validate(db_user)
+            user_cache.fill(user, token)
+        return user
 
-    async def get_user(self, session: AsyncSession, username: str, email: str | None = None) -> User | None:
-        """Fetch a user by username from the database."""
-        result = await session.execute(select(User).where(or_(User.username == username, User.email == email)))
-        user_record = result.scalars().first()
-        if user_record:
-            return user_record
-        return None
+    async def email_taken(self, session: AsyncSession, email: str) -> bool:
+        """Check whether a user with the email exists, an exact match on the unique email index."""
+        result = await session.execute(select(User.id).where(User.email == email).limit(1))
+        return result.first() is not None
 
     def create_access_token(self, data: dict, expires_delta: timedelta | None = None) -> str:
         """Create a short-lived JWT access token."""
@@ -46,3 +80,40 @@ class AuthService:
             expire = datetime.now(UTC) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
         to_encode.update({"exp": expire})
         return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+
+    async def authenticate_token(self, session: AsyncSession, token: str) -> UserRead | None:
+        """Return the active user an access token was issued to.
+
+        Args:
+            session (AsyncSession): The database session, only used when the token is not cached.
+            token (str): The encoded JWT access token.
+
+        Returns:
+            UserRead | None: The user, None if the token is invalid or expired, or the user is gone or inactive.
+        """
+        claims = self.token_cache.get(token)
+        if claims is None:
+            try:
+                claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM], options={"require": ["exp", "sub"]})
+            except jwt.InvalidTokenError:
+                return None
+            self.token_cache.set(token, claims)
+        elif claims["exp"] <= datetime.now(UTC).timestamp():
+            self.token_cache.pop(token)
+            return None
+
+        user = await self.get_user(session, claims["sub"])
+        if user is None or not user.is_active:
+            return None
+        return user
+
+    def stats(self) -> dict:
+        """Return the statistics of the token and the user caches."""
+        return {"token_cache": self.token_cache.stats(), "user_cache": user_cache.stats()}
+
+
+auth_service = AuthService(
+    hash_workers=backend_settings.password_hash_workers,
+    token_cache_size=backend_settings.token_cache_size,
+    token_cache_ttl_seconds=backend_settings.token_cache_ttl_s,
+)
@@ -0,0 +1,236 @@
+"""Export of recordings as a training dataset split into fixed-size shards."""
+
+import asyncio
+import datetime
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import BinaryIO, NamedTuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.db_models import Image, Keypoints, Recording
+from backend.src.models import backend_settings
+from backend.src.services.frame_store import frame_store
+from backend.src.services.keypoint_service import keypoint_service
+from backend.src.utils import atomic_write
+
+EXPORT_CONTENTS = ("keypoints", "frames")
+EXPORT_FORMATS = ("h5", "npz")
+
+RECORDING_COLUMNS = (Recording.id, Recording.user_id, Recording.created_at, Recording.prediction, Recording.feedback)
+
+
+class ExportRecord(NamedTuple):
+    """A recording as it is exported, with either its keypoint sequence or its encoded frames."""
+
+    recording_id: int
+    user_id: int
+    created_at: datetime.datetime
+    prediction: str | None
+    feedback: int | None
+    keypoints: np.ndarray | None = None
+    frames: list[bytes] | None = None
+
+
+class ExportService:
+    """A service class to export recordings into fixed-size HDF5 or NPZ shards.
+
+    Recordings are streamed in id order through a server-side cursor and at most one shard is held
+    in memory, so the memory use of an export does not depend on the size of the table. A shard
+    covers a contiguous id range and an export resumes after the last id of the previous shard.
+
+    A shard holds one entry per recording in `recording_ids`, `user_ids`, `created_at` (microseconds
+    since the epoch), `predictions` (UTF-8, empty if missing), `feedback` and `has_feedback`, plus
+    either `keypoints` of shape (recordings, frames, features) or the encoded frames concatenated in
+    `frames`, split by `frame_offsets` into frames and by `recording_offsets` into recordings.
+
+    Attributes:
+        shard_size (int): The number of recordings per shard.
+        fetch_size (int): The number of rows fetched from the cursor at a time.
+    """
+
+    def __init__(self, shard_size: int, fetch_size: int) -> None:
+        """Initialize the service.
+
+        Args:
+            shard_size (int): The number of recordings per shard.
+            fetch_size (int): The number of rows fetched from the cursor at a time.
+        """
+        self.shard_size = shard_size
+        self.fetch_size = fetch_size
+
+    async def iter_records(
+        self, session: AsyncSession, *, content: str = "keypoints", after_id: int = 0
+    ) -> AsyncIterator[ExportRecord]:
+        """Stream the recordings after an id in id order.
+
+        Args:
+            session (AsyncSession): The database session.
+            content (str): Export the "keypoints" or the encoded "frames" of the recordings.
+            after_id (int): Only export recordings with a greater id.
+
+        Yields:
+            ExportRecord: The recordings, skipping those without the requested content.
+
+        Raises:
+            ValueError: If the content is not supported.
+        """
+        if content == "keypoints":
+            statement = (
+                select(*RECORDING_COLUMNS, Keypoints.data, Keypoints.dtype, Keypoints.frames, Keypoints.features)
+                .join(Keypoints, Keypoints.recording_id == Recording.id)
+                .where(Recording.id > after_id)
+                .order_by(Recording.id)
+            )
+            result = await session.stream(statement.execution_options(yield_per=self.fetch_size))
+            async for row in result:
+                yield ExportRecord(*row[:5], keypoints=keypoint_service.unpack(row).astype(np.float32))
+        elif content == "frames":
+            statement = (
+                select(*RECORDING_COLUMNS, Image.content_hash)
+                .join(Image, Image.recording_id == Recording.id)
+                .where(Recording.id > after_id)
+                .order_by(Recording.id, Image.id)
+            )
+            result = await session.stream(statement.execution_options(yield_per=self.fetch_size))
+            recording, hashes = None, []
+            async for row in result:
+                if recording is not None and row.id != recording[0]:
+                    yield await self._with_frames(recording, hashes)
+                    hashes = []
+                recording = row[:5]
+                hashes.append(row.content_hash)
+            if recording is not None:
+                yield await self._with_frames(recording, hashes)
+        else:
+            msg = f"Unsupported export content: {content}"
+            raise ValueError(msg)
+
+    async def iter_shards(
+        self, session: AsyncSession, *, content: str = "keypoints", after_id: int = 0, shard_size: int | None = None
+    ) -> AsyncIterator[list[ExportRecord]]:
+        """Stream the recordings after an id grouped into shards.
+
+        Args:
+            session (AsyncSession): The database session.
+            content (str): Export the "keypoints" or the encoded "frames" of the recordings.
+            after_id (int): Only export recordings with a greater id.
+            shard_size (int | None): The number of recordings per shard, None for the service default.
+
+        Yields:
+            list[ExportRecord]: The recordings of a shard, the last shard may be smaller.
+        """
+        shard_size = shard_size or self.shard_size
+        shard = []
+        async for record in self.iter_records(session, content=content, after_id=after_id):
+            shard.append(record)
+            if len(shard) == shard_size:
+                yield shard
+                shard = []
+        if shard:
+            yield shard
+
+    def to_arrays(self, records: list[ExportRecord]) -> dict[str, np.ndarray]:
+        """Convert the recordings of a shard into the arrays of the shard file."""
+        arrays = {
+            "recording_ids": np.array([record.recording_id for record in records], dtype=np.int64),
+            "user_ids": np.array([record.user_id for record in records], dtype=np.int64),
+            "created_at": np.array([record.created_at for record in records], dtype="datetime64[us]").astype(np.int64),
+            "predictions": np.array([(record.prediction or "").encode() for record in records], dtype=bytes),
+            "feedback": np.array([record.feedback or 0 for record in records], dtype=np.int64),
+            "has_feedback": np.array([record.feedback is not None for record in records], dtype=bool),
+        }
+        if records and records[0].keypoints is not None:
+            arrays["keypoints"] = np.stack([record.keypoints for record in records])
+        else:
+            frames = [frame for record in records for frame in record.frames or []]
+            arrays["frames"] = np.frombuffer(b"".join(frames), dtype=np.uint8)
+            arrays["frame_offsets"] = np.cumsum([0, *map(len, frames)], dtype=np.int64)
+            arrays["recording_offsets"] = np.cumsum(
+                [0, *(len(record.frames or []) for record in records)], dtype=np.int64
+            )
+        return arrays
+
+    def write_shard(self, records: list[ExportRecord], target: str | Path | BinaryIO, fmt: str = "h5") -> None:
+        """Write the recordings of a shard to a file or a binary buffer.
+
+        Args:
+            records (list[ExportRecord]): The recordings of the shard.
+            target (str | Path | BinaryIO): The file path or the buffer to write to.
+            fmt (str): The shard format, "h5" or "npz".
+
+        Raises:
+            ValueError: If the format is not supported.
+        """
+        arrays = self.to_arrays(records)
+        if fmt == "npz":
+            np.savez_compressed(target, **arrays)
+        elif fmt == "h5":
+            import h5py
+
+            with h5py.File(target, "w") as file:
+                for name, array in arrays.items():
+                    file.create_dataset(name, data=array, compression="gzip" if name == "keypoints" else None)
+        else:
+            msg = f"Unsupported export format: {fmt}"
+            raise ValueError(msg)
+
+    def shard_name(self, records: list[ExportRecord], fmt: str = "h5") -> str:
+        """Return the file name of a shard, made of the first and the last recording id it holds."""
+        return f"recordings-{records[0].recording_id:010d}-{records[-1].recording_id:010d}.{fmt}"
+
+    def last_exported_id(self, directory: str | Path) -> int:
+        """Return the last recording id of the shards already exported to a directory, 0 if there are none."""
+        last_ids = [int(path.stem.rsplit("-", 1)[1]) for path in Path(directory).glob("recordings-*-*.*")]
+        return max(last_ids, default=0)
+
+    async def export(  # noqa: PLR0913
+        self,
+        session: AsyncSession,
+        directory: str | Path,
+        *,
+        content: str = "keypoints",
+        fmt: str = "h5",
+        after_id: int | None = None,
+        shard_size: int | None = None,
+    ) -> list[Path]:
+        """Export the recordings into shard files, resuming after the shards already in the directory.
+
+        Every shard is written to a temporary file and renamed, so an interrupted export never leaves a
+        partial shard behind and can simply be run again.
+
+        Args:
+            session (AsyncSession): The database session.
+            directory (str | Path): The directory of the shard files, created if missing.
+            content (str): Export the "keypoints" or the encoded "frames" of the recordings.
+            fmt (str): The shard format, "h5" or "npz".
+            after_id (int | None): Only export recordings with a greater id, None to resume after the
+                last shard in the directory.
+            shard_size (int | None): The number of recordings per shard, None for the service default.
+
+        Returns:
+            list[Path]: The paths of the written shards.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        if after_id is None:
+            after_id = self.last_exported_id(directory)
+
+        written = []
+        async for shard in self.iter_shards(session, content=content, after_id=after_id, shard_size=shard_size):
+            path = directory / self.shard_name(shard, fmt)
+            with atomic_write(path) as tmp:
+                await asyncio.to_thread(self.write_shard, shard, tmp, fmt)
+            written.append(path)
+        return written
+
+    @staticmethod
+    async def _with_frames(recording: tuple, hashes: list[str]) -> ExportRecord:
+        """Read the encoded frames of a recording from the frame store."""
+        frames = await asyncio.to_thread(lambda: [frame_store.read(content_hash) for content_hash in hashes])
+        return ExportRecord(*recording, frames=frames)
+
+
+export_service = ExportService(backend_settings.export_shard_size, backend_settings.export_fetch_size)
@@ -0,0 +1,120 @@
+"""Content-addressed storage of recording frames outside of the database."""
+
+import hashlib
+import re
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO
+
+from pydantic import BaseModel
+
+from backend.src.models import backend_settings
+from backend.src.utils import atomic_write, sniff_image_type
+
+CONTENT_HASH_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+
+class StoredFrame(BaseModel):
+    """Reference to a frame held by a frame store.
+
+    Attributes:
+        content_hash (str): The SHA-256 hex digest of the frame bytes, which is also its key in the store.
+        size (int): The size of the frame in bytes.
+        format (str): The image format of the frame, "jpeg" or "png".
+    """
+
+    content_hash: str
+    size: int
+    format: str
+
+
+class FrameStore(ABC):
+    """Storage backend for encoded frames, keyed by the hash of their content.
+
+    Storing the same bytes twice yields the same key and keeps a single copy.
+    """
+
+    @abstractmethod
+    def put(self, content: bytes) -> StoredFrame:
+        """Store encoded frame bytes and return the reference to them."""
+
+    @abstractmethod
+    def stream(self, content_hash: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Yield the bytes of a stored frame in chunks.
+
+        Raises:
+            FileNotFoundError: If no frame with the given hash is stored.
+        """
+
+    def put_many(self, contents: list[bytes]) -> list[StoredFrame]:
+        """Store many frames, returning their references in the same order."""
+        return [self.put(content) for content in contents]
+
+    def read(self, content_hash: str) -> bytes:
+        """Return the bytes of a stored frame.
+
+        Raises:
+            FileNotFoundError: If no frame with the given hash is stored.
+        """
+        return b"".join(self.stream(content_hash))
+
+
+class LocalFrameStore(FrameStore):
+    """Frame store on the local filesystem.
+
+    Frames are sharded into two levels of directories named after the first hash characters, e.g.
+    `ab/cd/abcd...`, so no single directory grows too large. Writes go through a temporary file and
+    an atomic rename, so readers never see a partially written frame.
+
+    Attributes:
+        root (Path): The directory holding the frames.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        """Initialize the store.
+
+        Args:
+            root (str | Path): The directory holding the frames, created if missing.
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path(self, content_hash: str) -> Path:
+        """Return the path of a frame in the store.
+
+        Raises:
+            FileNotFoundError: If the hash is not a SHA-256 hex digest, so it can never name a path outside the store.
+        """
+        if not CONTENT_HASH_PATTERN.fullmatch(content_hash):
+            msg = f"Invalid frame content hash: {content_hash!r}"
+            raise FileNotFoundError(msg)
+        return self.root / content_hash[:2] / content_hash[2:4] / content_hash
+
+    def put(self, content: bytes) -> StoredFrame:
+        """Store encoded frame bytes unless an identical frame is already stored."""
+        content_hash = hashlib.sha256(content).hexdigest()
+        path = self.path(content_hash)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_write(path) as tmp:
+                tmp.write(content)
+        return StoredFrame(
+            content_hash=content_hash, size=len(content), format=sniff_image_type(content).removeprefix("image/")
+        )
+
+    def stream(self, content_hash: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Yield the bytes of a stored frame in chunks."""
+        # Opened eagerly so a missing frame fails before a response starts streaming.
+        file = self.path(content_hash).open("rb")
+        return self._read_chunks(file, chunk_size)
+
+    @staticmethod
+    def _read_chunks(file: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+        """Yield the content of an open file in chunks and close it."""
+        with file:
+            while chunk := file.read(chunk_size):
+                yield chunk
+
+
+frame_store: FrameStore = LocalFrameStore(backend_settings.frame_store_root)
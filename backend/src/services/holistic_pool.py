@@ -0,0 +1,114 @@
+"""Bounded pool of pre-initialized MediaPipe Holistic graphs."""
+
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mediapipe.python.solutions.holistic import Holistic
+
+
+class HolisticPool:
+    """Pool of initialized MediaPipe Holistic graphs with checkout/return semantics.
+
+    All graphs are created up front so no request pays the graph set-up. A checked out graph is
+    reset when it is returned, so landmark tracking state never leaks from one recording to the next.
+
+    Attributes:
+        size (int): The number of graphs held by the pool.
+        timeout (float | None): How long a checkout waits for a free graph, None waits forever.
+    """
+
+    def __init__(self, factory: Callable[[], "Holistic"], size: int, timeout: float | None = None) -> None:
+        """Initialize the pool and create all of its graphs.
+
+        Args:
+            factory (Callable[[], Holistic]): Creates a new Holistic graph.
+            size (int): The number of graphs held by the pool.
+            timeout (float | None): How long a checkout waits for a free graph, None waits forever.
+        """
+        self.size = size
+        self.timeout = timeout
+        self._factory = factory
+        self._idle: queue.LifoQueue[Holistic] = queue.LifoQueue(maxsize=size)
+        for _ in range(size):
+            self._idle.put(factory())
+        self._lock = threading.Lock()
+        self._checkouts = 0
+        self._exhausted = 0
+        self._timeouts = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+    @contextmanager
+    def checkout(self) -> Iterator["Holistic"]:
+        """Check out a graph for the duration of one recording.
+
+        Yields:
+            Holistic: A graph with no tracking state from previous recordings.
+
+        Raises:
+            TimeoutError: If no graph became free within the pool timeout.
+        """
+        start = time.perf_counter()
+        exhausted = False
+        try:
+            holistic = self._idle.get_nowait()
+        except queue.Empty:
+            exhausted = True
+            try:
+                holistic = self._idle.get(timeout=self.timeout)
+            except queue.Empty as e:
+                with self._lock:
+                    self._exhausted += 1
+                    self._timeouts += 1
+                msg = "No MediaPipe Holistic graph became available"
+                raise TimeoutError(msg) from e
+        waited = time.perf_counter() - start
+        with self._lock:
+            self._checkouts += 1
+            self._exhausted += exhausted
+            self._wait_seconds += waited
+            self._max_wait_seconds = max(self._max_wait_seconds, waited)
+
+        try:
+            yield holistic
+        finally:
+            self._idle.put(self._reset(holistic))
+
+    def close(self) -> None:
+        """Close all idle graphs of the pool."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def stats(self) -> dict:
+        """Return the pool size and checkout counters.
+
+        `exhausted` counts the checkouts that found no idle graph, `timeouts` those of them that were
+        refused because none became free within the pool timeout.
+        """
+        with self._lock:
+            return {
+                "size": self.size,
+                "idle": self._idle.qsize(),
+                "checkouts": self._checkouts,
+                "exhausted": self._exhausted,
+                "timeouts": self._timeouts,
+                "avg_wait_ms": 1000 * self._wait_seconds / self._checkouts if self._checkouts else 0.0,
+                "max_wait_ms": 1000 * self._max_wait_seconds,
+            }
+
+    def _reset(self, holistic: "Holistic") -> "Holistic":
+        """Drop the tracking state of a graph, replacing the graph if it can not be reset."""
+        try:
+            holistic.reset()
+        except Exception:
+            holistic.close()
+            return self._factory()
+        return holistic
@@ -0,0 +1,183 @@
+"""Selectable inference backends for the sign classifier.
+
+TensorFlow is imported lazily by the backends, so importing this module does not pull it in.
+"""
+
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import numpy as np
+
+from backend.src.services.keypoints import KEYPOINT_DTYPE, KEYPOINT_FEATURES, SEQUENCE_LENGTH
+from backend.src.utils import atomic_write
+
+TFLITE_QUANTIZATIONS = ("float32", "float16", "int8")
+
+
+class InferenceBackend(ABC):
+    """Runs the sign classifier on batches of keypoint sequences."""
+
+    name: str
+
+    @abstractmethod
+    def predict(self, sequences: np.ndarray) -> np.ndarray:
+        """Classify a batch of keypoint sequences.
+
+        Args:
+            sequences (np.ndarray): Float32 keypoint sequences of shape (N, frames, 1662).
+
+        Returns:
+            np.ndarray: Class probabilities of shape (N, classes).
+        """
+
+    def warm_up(self) -> None:
+        """Run one inference on a dummy sequence so the first request does not pay for tracing."""
+        self.predict(np.zeros((1, SEQUENCE_LENGTH, KEYPOINT_FEATURES), dtype=KEYPOINT_DTYPE))
+
+
+class KerasBackend(InferenceBackend):
+    """Runs the full Keras model loaded from the H5 file.
+
+    The model is called through a `tf.function` with a fixed (None, 30, 1662) float32 input signature,
+    which is traced once during warm-up and skips the per-call overhead of `model.predict`.
+    """
+
+    name = "keras"
+
+    def __init__(self, model_path: str) -> None:
+        """Load the Keras model.
+
+        Args:
+            model_path (str): The path of the H5 model file.
+        """
+        import tensorflow as tf
+
+        self.model = tf.keras.models.load_model(model_path)
+        self._predict = tf.function(
+            lambda sequences: self.model(sequences, training=False),
+            input_signature=[tf.TensorSpec((None, SEQUENCE_LENGTH, KEYPOINT_FEATURES), tf.float32)],
+        )
+
+    def predict(self, sequences: np.ndarray) -> np.ndarray:
+        """Classify a batch of keypoint sequences with Keras."""
+        return self._predict(sequences).numpy()
+
+
+class TFLiteBackend(InferenceBackend):
+    """Runs a TFLite flatbuffer converted from the H5 model with the TFLite interpreter.
+
+    The interpreter keeps the (1, frames, 1662) input signature of the converted model and a batch is
+    run sequence by sequence: an invoke costs microseconds of overhead, and resizing the input of a
+    recurrent model on every batch size change would cost more than it saves.
+
+    Attributes:
+        quantization (str): The variant of the flatbuffer, "float32", "float16" or "int8" (dynamic range).
+    """
+
+    name = "tflite"
+
+    def __init__(self, model_path: str, quantization: str = "float32", num_threads: int | None = None) -> None:
+        """Convert the model if needed and load it into a TFLite interpreter.
+
+        Args:
+            model_path (str): The path of the H5 model file.
+            quantization (str): The variant of the flatbuffer, "float32", "float16" or "int8".
+            num_threads (int | None): The number of interpreter threads, None for the TFLite default.
+        """
+        import tensorflow as tf
+
+        self.quantization = quantization
+        self.tflite_path = convert_to_tflite(model_path, quantization)
+        self._interpreter = tf.lite.Interpreter(model_path=str(self.tflite_path), num_threads=num_threads)
+        self._interpreter.allocate_tensors()
+        self._input = self._interpreter.get_input_details()[0]["index"]
+        self._output = self._interpreter.get_output_details()[0]["index"]
+        # The interpreter holds its tensors in place and must not be invoked concurrently.
+        self._lock = threading.Lock()
+
+    def predict(self, sequences: np.ndarray) -> np.ndarray:
+        """Classify a batch of keypoint sequences with the TFLite interpreter."""
+        results = []
+        with self._lock:
+            for sequence in sequences:
+                self._interpreter.set_tensor(self._input, sequence[np.newaxis])
+                self._interpreter.invoke()
+                results.append(self._interpreter.get_tensor(self._output)[0].copy())
+        return np.stack(results)
+
+
+def convert_to_tflite(model_path: str, quantization: str = "float32") -> Path:
+    """Convert an H5 Keras model into a TFLite flatbuffer next to it.
+
+    The flatbuffer is written once to `<model>.<quantization>.tflite` and reused until the H5 file
+    is newer than it.
+
+    Args:
+        model_path (str): The path of the H5 model file.
+        quantization (str): "float32" for no quantization, "float16" for float16 weights or "int8"
+            for dynamic-range int8 weights.
+
+    Returns:
+        Path: The path of the flatbuffer.
+
+    Raises:
+        ValueError: If the quantization is not supported.
+    """
+    if quantization not in TFLITE_QUANTIZATIONS:
+        msg = f"Unsupported TFLite quantization: {quantization}"
+        raise ValueError(msg)
+    import tensorflow as tf
+
+    source = Path(model_path)
+    target = source.with_suffix(f".{quantization}.tflite")
+    if target.exists() and target.stat().st_mtime >= source.stat().st_mtime:
+        return target
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(tf.keras.models.load_model(source))
+    # Recurrent layers need TF ops that have no TFLite builtin counterpart.
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS, tf.lite.OpsSet.SELECT_TF_OPS]
+    converter._experimental_lower_tensor_list_ops = False  # noqa: SLF001
+    if quantization != "float32":
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    if quantization == "float16":
+        converter.target_spec.supported_types = [tf.float16]
+    flatbuffer = converter.convert()
+
+    with atomic_write(target) as tmp:
+        tmp.write(flatbuffer)
+    return target
+
+
+def model_version(model_path: str, variant: str) -> str:
+    """Return the version of a model file, derived from the backend variant and the file modification time and size."""
+    try:
+        stat = Path(model_path).stat()
+    except FileNotFoundError:
+        return f"{variant}-missing"
+    return f"{variant}-{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def load_backend(
+    name: str, model_path: str, quantization: str = "float32", num_threads: int | None = None
+) -> InferenceBackend:
+    """Create the inference backend selected by name.
+
+    Args:
+        name (str): "keras" or "tflite".
+        model_path (str): The path of the H5 model file.
+        quantization (str): The TFLite flatbuffer variant, ignored by the Keras backend.
+        num_threads (int | None): The number of TFLite interpreter threads, ignored by the Keras backend.
+
+    Returns:
+        InferenceBackend: The loaded backend.
+
+    Raises:
+        ValueError: If the backend name is not known.
+    """
+    if name == KerasBackend.name:
+        return KerasBackend(model_path)
+    if name == TFLiteBackend.name:
+        return TFLiteBackend(model_path, quantization, num_threads)
+    msg = f"Unknown inference backend: {name}"
+    raise ValueError(msg)
@@ -0,0 +1,151 @@
+"""Micro-batching of concurrent classifier calls into a single predict."""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from backend.src.models import backend_settings
+from backend.src.services.tranlsation_service import translation_service
+
+
+class InferenceBatcher:
+    """Collects keypoint sequences of concurrent requests and classifies them in one batch.
+
+    Requests are queued and a background task drains the queue: the first queued sequence opens a
+    batching window of `max_wait_ms`, the window closes early once `max_batch_size` sequences were
+    collected. Sequences are stacked into one (N, frames, 1662) tensor, classified with a single
+    predict call and the probabilities are fanned back out to the awaiting callers.
+
+    Attributes:
+        max_batch_size (int): The maximum number of sequences classified in one predict call.
+        max_wait_ms (float): How long the first sequence of a batch waits for others to join.
+        max_queue_size (int): The maximum number of queued sequences before callers are held back.
+    """
+
+    def __init__(
+        self,
+        predict_fn: Callable[[np.ndarray], np.ndarray],
+        max_batch_size: int,
+        max_wait_ms: float,
+        max_queue_size: int,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            predict_fn (Callable): Maps a (N, frames, 1662) batch to (N, classes) probabilities.
+            max_batch_size (int): The maximum number of sequences classified in one predict call.
+            max_wait_ms (float): How long the first sequence of a batch waits for others to join.
+            max_queue_size (int): The maximum number of queued sequences before callers are held back.
+        """
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.max_queue_size = max_queue_size
+        self._queue: asyncio.Queue[tuple[np.ndarray, asyncio.Future]] | None = None
+        self._task: asyncio.Task | None = None
+        self._requests = 0
+        self._batches = 0
+        self._largest_batch = 0
+        self._predict_seconds = 0.0
+
+    async def start(self) -> None:
+        """Start the background batching task."""
+        if self._task is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background batching task and fail sequences that are still queued."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Inference batcher stopped"))
+
+    async def predict(self, sequence: np.ndarray) -> np.ndarray:
+        """Classify one keypoint sequence.
+
+        Falls back to an unbatched predict in a worker thread when the batcher is not running.
+
+        Args:
+            sequence (np.ndarray): Keypoint sequence of shape (frames, 1662).
+
+        Returns:
+            np.ndarray: Class probabilities of the sequence.
+        """
+        if self._task is None:
+            return (await asyncio.to_thread(self.predict_fn, sequence[np.newaxis]))[0]
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((sequence, future))
+        return await future
+
+    def stats(self) -> dict:
+        """Return the batcher configuration and throughput counters."""
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+            "max_queue_size": self.max_queue_size,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "requests": self._requests,
+            "batches": self._batches,
+            "avg_batch_size": self._requests / self._batches if self._batches else 0.0,
+            "largest_batch": self._largest_batch,
+            "avg_predict_ms": 1000 * self._predict_seconds / self._batches if self._batches else 0.0,
+        }
+
+    async def _run(self) -> None:
+        """Collect batches from the queue and dispatch them until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait_ms / 1000
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except TimeoutError:
+                    break
+            await self._dispatch(batch)
+
+    async def _dispatch(self, batch: list[tuple[np.ndarray, asyncio.Future]]) -> None:
+        """Classify a collected batch and resolve the futures of its callers."""
+        batch = [(sequence, future) for sequence, future in batch if not future.done()]
+        # Recordings with a different number of frames can not be stacked together.
+        by_shape: dict[tuple[int, ...], list[tuple[np.ndarray, asyncio.Future]]] = {}
+        for sequence, future in batch:
+            by_shape.setdefault(sequence.shape, []).append((sequence, future))
+
+        for group in by_shape.values():
+            start = time.perf_counter()
+            try:
+                probabilities = await asyncio.to_thread(self.predict_fn, np.stack([seq for seq, _ in group]))
+            except Exception as e:
+                for _, future in group:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            self._predict_seconds += time.perf_counter() - start
+            self._requests += len(group)
+            self._batches += 1
+            self._largest_batch = max(self._largest_batch, len(group))
+            for (_, future), result in zip(group, probabilities, strict=True):
+                if not future.done():
+                    future.set_result(result)
+
+
+inference_batcher = InferenceBatcher(
+    translation_service.predict_batch,
+    max_batch_size=backend_settings.batch_max_size,
+    max_wait_ms=backend_settings.batch_max_wait_ms,
+    max_queue_size=backend_settings.batch_max_queue_size,
+)
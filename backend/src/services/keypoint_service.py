@@ -0,0 +1,76 @@
+"""A service class to store and load the keypoint sequences of recordings."""
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.db_models import Keypoints
+from backend.src.models import backend_settings
+
+
+class KeypointService:
+    """A service class to pack keypoint sequences into compact binary rows and load them back.
+
+    Attributes:
+        dtype (np.dtype): The dtype sequences are packed with, float32 or float16.
+    """
+
+    def __init__(self, dtype: str) -> None:
+        """Initialize the service.
+
+        Args:
+            dtype (str): The dtype sequences are packed with, "float32" or "float16".
+        """
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float16):
+            msg = f"Unsupported keypoint storage dtype: {dtype}"
+            raise ValueError(msg)
+
+    def pack(self, recording_id: int, sequence: np.ndarray) -> Keypoints:
+        """Pack a (frames, features) keypoint sequence into a Keypoints row."""
+        frames, features = sequence.shape
+        return Keypoints(
+            recording_id=recording_id,
+            data=np.ascontiguousarray(sequence, dtype=self.dtype).tobytes(),
+            dtype=self.dtype.name,
+            frames=frames,
+            features=features,
+        )
+
+    def unpack(self, keypoints: Keypoints) -> np.ndarray:
+        """Unpack a Keypoints row into a (frames, features) array of its stored dtype."""
+        return np.frombuffer(keypoints.data, dtype=keypoints.dtype).reshape(keypoints.frames, keypoints.features)
+
+    async def load(self, session: AsyncSession, recording_ids: list[int]) -> np.ndarray:
+        """Load the keypoint sequences of many recordings as one stacked array.
+
+        Args:
+            session (AsyncSession): The database session.
+            recording_ids (list[int]): The recordings to load, in the order of the stacked array.
+
+        Returns:
+            np.ndarray: A float32 array of shape (len(recording_ids), frames, features).
+
+        Raises:
+            KeyError: If a recording has no stored keypoints.
+            ValueError: If the sequences do not share the same shape.
+        """
+        result = await session.execute(select(Keypoints).where(Keypoints.recording_id.in_(recording_ids)))
+        by_recording = {row.recording_id: row for row in result.scalars()}
+        missing = [recording_id for recording_id in recording_ids if recording_id not in by_recording]
+        if missing:
+            raise KeyError(missing)
+
+        shapes = {(row.frames, row.features) for row in by_recording.values()}
+        if len(shapes) > 1:
+            msg = f"Keypoint sequences have different shapes: {sorted(shapes)}"
+            raise ValueError(msg)
+        frames, features = shapes.pop() if shapes else (0, 0)
+
+        stacked = np.empty((len(recording_ids), frames, features), dtype=np.float32)
+        for out, recording_id in zip(stacked, recording_ids, strict=True):
+            out[:] = self.unpack(by_recording[recording_id])
+        return stacked
+
+
+keypoint_service = KeypointService(backend_settings.keypoint_storage_dtype)
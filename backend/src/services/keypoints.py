@@ -0,0 +1,65 @@
+"""Keypoint layout of the sign classifier input and extraction of MediaPipe landmarks into it."""
+
+from itertools import chain
+
+import numpy as np
+
+SEQUENCE_LENGTH = 30
+POSE_LANDMARKS = 33
+FACE_LANDMARKS = 468
+HAND_LANDMARKS = 21
+
+POSE = slice(0, POSE_LANDMARKS * 4)
+FACE = slice(POSE.stop, POSE.stop + FACE_LANDMARKS * 3)
+LEFT_HAND = slice(FACE.stop, FACE.stop + HAND_LANDMARKS * 3)
+RIGHT_HAND = slice(LEFT_HAND.stop, LEFT_HAND.stop + HAND_LANDMARKS * 3)
+KEYPOINT_FEATURES = RIGHT_HAND.stop
+
+KEYPOINT_DTYPE = np.float32
+
+
+def allocate_sequence(frames: int = SEQUENCE_LENGTH) -> np.ndarray:
+    """Allocate a zeroed keypoint sequence buffer.
+
+    Args:
+        frames (int): The number of frames in the sequence.
+
+    Returns:
+        np.ndarray: A float32 buffer of shape (frames, KEYPOINT_FEATURES).
+    """
+    return np.zeros((frames, KEYPOINT_FEATURES), dtype=KEYPOINT_DTYPE)
+
+
+def write_keypoints(results: object, out: np.ndarray) -> None:
+    """Write the landmarks of one MediaPipe Holistic result into one row of a sequence buffer.
+
+    The row layout is pose (x, y, z, visibility), face (x, y, z), left hand (x, y, z) and right hand
+    (x, y, z). Parts that were not detected are zero-filled. Each detected part is read into one small
+    float32 array with `np.fromiter` and copied into its slice of the row, so no per-landmark lists or
+    float64 arrays are built.
+
+    Args:
+        results (object): The MediaPipe Holistic processing results of one frame.
+        out (np.ndarray): The float32 row of length KEYPOINT_FEATURES to write into.
+    """
+    if results.pose_landmarks:
+        out[POSE] = np.fromiter(
+            chain.from_iterable((lm.x, lm.y, lm.z, lm.visibility) for lm in results.pose_landmarks.landmark),
+            dtype=KEYPOINT_DTYPE,
+            count=POSE.stop - POSE.start,
+        )
+    else:
+        out[POSE] = 0
+    _write_xyz(results.face_landmarks, out[FACE])
+    _write_xyz(results.left_hand_landmarks, out[LEFT_HAND])
+    _write_xyz(results.right_hand_landmarks, out[RIGHT_HAND])
+
+
+def _write_xyz(landmarks: object | None, out: np.ndarray) -> None:
+    """Write the (x, y, z) coordinates of a landmark list into a slice, zero-filling it when missing."""
+    if landmarks:
+        out[:] = np.fromiter(
+            chain.from_iterable((lm.x, lm.y, lm.z) for lm in landmarks.landmark), dtype=KEYPOINT_DTYPE, count=out.size
+        )
+    else:
+        out[:] = 0
@@ -0,0 +1,117 @@
+"""Continuous sliding-window sign recognition over a live frame stream."""
+
+import numpy as np
+
+from backend.src.services.keypoints import KEYPOINT_DTYPE, SEQUENCE_LENGTH, allocate_sequence
+
+
+class SlidingWindow:
+    """Fixed-size ring buffer of keypoint rows holding the last `length` frames of a stream.
+
+    Every row is stored twice, `length` rows apart, in a buffer of 2 * `length` rows. The last
+    `length` frames are then always one contiguous slice of the buffer, so reading the window in frame
+    order needs neither np.roll nor any per-frame allocation.
+
+    Attributes:
+        length (int): The number of frames in the window.
+        frames (int): The number of frames pushed so far.
+    """
+
+    def __init__(self, length: int = SEQUENCE_LENGTH) -> None:
+        """Initialize the window.
+
+        Args:
+            length (int): The number of frames in the window.
+        """
+        self.length = length
+        self.frames = 0
+        self._buffer = allocate_sequence(2 * length)
+
+    @property
+    def full(self) -> bool:
+        """Whether the window holds `length` frames."""
+        return self.frames >= self.length
+
+    def next_row(self) -> np.ndarray:
+        """Return the row the keypoints of the next frame have to be written into."""
+        return self._buffer[self.frames % self.length]
+
+    def advance(self) -> None:
+        """Commit the row returned by `next_row` as the newest frame of the window."""
+        position = self.frames % self.length
+        self._buffer[position + self.length] = self._buffer[position]
+        self.frames += 1
+
+    def view(self) -> np.ndarray:
+        """Return the last `length` frames, oldest first, as a view into the buffer."""
+        start = self.frames % self.length
+        return self._buffer[start : start + self.length]
+
+
+class LiveRecognizer:
+    """Turns a stream of keypoint frames into debounced, smoothed sign predictions.
+
+    The classifier runs every `stride` frames over the last SEQUENCE_LENGTH frames. Its class
+    probabilities are smoothed with an exponential moving average and a sign is emitted once its
+    smoothed confidence reaches `threshold`. The same sign is emitted again only after its
+    confidence dropped below the threshold in between.
+
+    Attributes:
+        stride (int): The number of new frames between two classifier runs.
+        threshold (float): The smoothed confidence a sign needs to be emitted.
+        smoothing (float): The weight of the newest probabilities in the moving average, 1 disables smoothing.
+        window (SlidingWindow): The keypoints of the last SEQUENCE_LENGTH frames.
+    """
+
+    def __init__(self, classes: int, stride: int, threshold: float, smoothing: float) -> None:
+        """Initialize the recognizer.
+
+        Args:
+            classes (int): The number of classes of the classifier.
+            stride (int): The number of new frames between two classifier runs.
+            threshold (float): The smoothed confidence a sign needs to be emitted.
+            smoothing (float): The weight of the newest probabilities in the moving average.
+        """
+        self.stride = stride
+        self.threshold = threshold
+        self.smoothing = smoothing
+        self.window = SlidingWindow()
+        self._snapshot = allocate_sequence()
+        self._smoothed = np.zeros(classes, dtype=KEYPOINT_DTYPE)
+        self._last_emitted: int | None = None
+
+    def push(self) -> bool:
+        """Commit the frame written into `window.next_row()`.
+
+        Returns:
+            bool: Whether the classifier is due to run on the current window.
+        """
+        self.window.advance()
+        return self.window.full and (self.window.frames - self.window.length) % self.stride == 0
+
+    def snapshot(self) -> np.ndarray:
+        """Copy the current window into a reusable buffer that later frames do not overwrite."""
+        np.copyto(self._snapshot, self.window.view())
+        return self._snapshot
+
+    def update(self, probabilities: np.ndarray) -> tuple[int, float] | None:
+        """Fold new class probabilities into the moving average.
+
+        Args:
+            probabilities (np.ndarray): The classifier output for the current window.
+
+        Returns:
+            tuple[int, float] | None: The class index and smoothed confidence of a newly recognized
+                sign, None if nothing should be emitted.
+        """
+        self._smoothed *= 1 - self.smoothing
+        self._smoothed += self.smoothing * probabilities
+        best = int(np.argmax(self._smoothed))
+        confidence = float(self._smoothed[best])
+
+        if self._last_emitted is not None and self._smoothed[self._last_emitted] < self.threshold:
+            self._last_emitted = None
+        if confidence < self.threshold or best == self._last_emitted:
+            return None
+        self._last_emitted = best
+        return best, confidence
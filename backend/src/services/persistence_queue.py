@@ -0,0 +1,145 @@
+"""Write-behind persistence of recording frames and keypoints."""
+
+import asyncio
+import contextlib
+import logging
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from backend.src.db import async_session
+from backend.src.models import backend_settings
+from backend.src.services.frame_store import frame_store
+from backend.src.services.recording_service import recording_service
+
+logger = logging.getLogger(__name__)
+
+
+class PendingRecording(NamedTuple):
+    """Frames and keypoints of an already inserted recording that still have to be persisted."""
+
+    recording_id: int
+    frames: list[bytes]
+    keypoints: np.ndarray | None
+    enqueued_at: float
+
+
+class PersistenceQueue:
+    """Bounded in-process queue persisting recording frames in the background.
+
+    The recording row itself is inserted by the request, so its id and `/feedback` work right away.
+    Its frames and keypoints are queued here and a background task writes them in batches that span
+    several requests: frames go to the frame store and image/keypoint rows are inserted with one
+    multi-row INSERT per table. A full queue makes producers wait, and stopping the queue flushes
+    everything that is still queued.
+
+    Attributes:
+        max_size (int): The maximum number of queued recordings before producers wait.
+        batch_size (int): The maximum number of recordings written in one transaction.
+    """
+
+    def __init__(self, max_size: int, batch_size: int) -> None:
+        """Initialize the queue.
+
+        Args:
+            max_size (int): The maximum number of queued recordings before producers wait.
+            batch_size (int): The maximum number of recordings written in one transaction.
+        """
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self._queue: asyncio.Queue[PendingRecording] | None = None
+        self._task: asyncio.Task | None = None
+        self._flushed = 0
+        self._batches = 0
+        self._failed = 0
+        self._last_lag_seconds = 0.0
+        self._max_lag_seconds = 0.0
+
+    @property
+    def running(self) -> bool:
+        """Whether the queue accepts recordings."""
+        return self._task is not None
+
+    async def start(self) -> None:
+        """Start the background writer task."""
+        if self._task is None:
+            self._queue = asyncio.Queue(maxsize=self.max_size)
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flush all queued recordings and stop the background writer task."""
+        if self._task is None:
+            return
+        await self._queue.join()
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def put(self, recording_id: int, frames: list[bytes], keypoints: np.ndarray | None) -> None:
+        """Queue the frames and keypoints of a recording, waiting while the queue is full."""
+        await self._queue.put(PendingRecording(recording_id, frames, keypoints, time.monotonic()))
+
+    def stats(self) -> dict:
+        """Return the queue depth, write counters and persistence lag."""
+        return {
+            "running": self.running,
+            "max_size": self.max_size,
+            "batch_size": self.batch_size,
+            "depth": self._queue.qsize() if self._queue else 0,
+            "flushed": self._flushed,
+            "batches": self._batches,
+            "failed": self._failed,
+            "last_lag_ms": 1000 * self._last_lag_seconds,
+            "max_lag_ms": 1000 * self._max_lag_seconds,
+        }
+
+    async def _run(self) -> None:
+        """Write queued recordings in batches until cancelled."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._flush_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _flush_batch(self, batch: list[PendingRecording]) -> None:
+        """Write a batch, retrying its recordings one by one if the batch fails.
+
+        A single bad row, e.g. of a recording deleted before the flush, then only loses that recording.
+        """
+        try:
+            await self._flush(batch)
+        except Exception:
+            if len(batch) == 1:
+                self._failed += 1
+                logger.exception("Failed to persist frames of recording %s", batch[0].recording_id)
+                return
+            logger.warning("Failed to persist a batch of %d recordings, retrying them one by one", len(batch))
+            for item in batch:
+                await self._flush_batch([item])
+
+    async def _flush(self, batch: list[PendingRecording]) -> None:
+        """Store the frames of a batch and insert its image and keypoint rows in one transaction."""
+        stored = await asyncio.to_thread(lambda: [frame_store.put_many(item.frames) for item in batch])
+        async with async_session() as session:
+            await recording_service.add_frames(
+                session,
+                [(item.recording_id, images, item.keypoints) for item, images in zip(batch, stored, strict=True)],
+            )
+            await session.commit()
+
+        lag = time.monotonic() - batch[0].enqueued_at
+        self._flushed += len(batch)
+        self._batches += 1
+        self._last_lag_seconds = lag
+        self._max_lag_seconds = max(self._max_lag_seconds, lag)
+
+
+persistence_queue = PersistenceQueue(
+    max_size=backend_settings.write_behind_queue_size, batch_size=backend_settings.write_behind_batch_size
+)
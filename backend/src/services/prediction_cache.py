@@ -0,0 +1,76 @@
+"""Cache of predictions for byte-identical frame submissions."""
+
+import hashlib
+from typing import NamedTuple
+
+import numpy as np
+
+from backend.src.cache import TTLCache
+from backend.src.models import backend_settings
+
+
+class CachedPrediction(NamedTuple):
+    """The prediction of a submission and the keypoints it was made from."""
+
+    prediction: str
+    keypoints: np.ndarray
+
+
+class PredictionCache:
+    """LRU/TTL cache of predicted classes and keypoints keyed by a hash of the submitted frames.
+
+    The keypoints are cached with the prediction, so a recording answered from the cache is stored
+    with its keypoints like any other. An entry takes about 200 KB of float32 keypoints.
+
+    Keys are tagged with the version of the model that made the prediction, as captured when the
+    model was loaded, and the whole cache is dropped as soon as another version is used, so a
+    retrained model never serves predictions of its predecessor.
+    """
+
+    def __init__(self, capacity: int, ttl_seconds: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            capacity (int): The maximum number of cached predictions, 0 disables the cache.
+            ttl_seconds (float): How long a prediction stays cached.
+        """
+        self._cache: TTLCache[str, CachedPrediction] = TTLCache(capacity, ttl_seconds)
+        self._model_version: str | None = None
+        self._invalidations = 0
+
+    def key(self, frames: list[bytes]) -> str:
+        """Hash the frames of a submission into a cache key."""
+        digest = hashlib.blake2b(digest_size=16)
+        for frame in frames:
+            digest.update(len(frame).to_bytes(8, "little"))
+            digest.update(frame)
+        return digest.hexdigest()
+
+    def get(self, model_version: str, key: str) -> CachedPrediction | None:
+        """Return the cached prediction of a submission made by a model version, None on a miss."""
+        self._check_model_version(model_version)
+        return self._cache.get(f"{model_version}:{key}")
+
+    def set(self, model_version: str, key: str, prediction: str, keypoints: np.ndarray) -> None:
+        """Cache the prediction of a submission made by a model version and the keypoints it was made from."""
+        self._check_model_version(model_version)
+        keypoints = keypoints.copy()
+        keypoints.setflags(write=False)
+        self._cache.set(f"{model_version}:{key}", CachedPrediction(prediction, keypoints))
+
+    def stats(self) -> dict:
+        """Return the cache statistics and the model version it is tagged with."""
+        return {**self._cache.stats(), "model_version": self._model_version, "invalidations": self._invalidations}
+
+    def _check_model_version(self, model_version: str) -> None:
+        """Drop all cached predictions if another model version is in use."""
+        if model_version != self._model_version:
+            if self._model_version is not None:
+                self._cache.clear()
+                self._invalidations += 1
+            self._model_version = model_version
+
+
+prediction_cache = PredictionCache(
+    capacity=backend_settings.prediction_cache_size, ttl_seconds=backend_settings.prediction_cache_ttl_s
+)
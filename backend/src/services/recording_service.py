@@ -0,0 +1,80 @@
+"""A service class to persist translated recordings."""
+
+import numpy as np
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.db_models import Image, Keypoints, Recording
+from backend.src.services.frame_store import StoredFrame
+from backend.src.services.keypoint_service import keypoint_service
+
+
+class RecordingService:
+    """A service class to persist translated recordings with a minimal number of round trips.
+
+    Rows are written with Core INSERT statements rather than ORM objects, so nothing is flushed
+    row by row, refreshed or tracked in the session identity map.
+    """
+
+    async def add_recording(self, session: AsyncSession, user_id: int, prediction: str | None = None) -> int:
+        """Insert a recording and return its id in the same statement."""
+        # A Core INSERT does not apply the model's default factory, so the timestamp is taken from it here.
+        created_at = Recording.model_fields["created_at"].default_factory()
+        return await session.scalar(
+            insert(Recording)
+            .values(user_id=user_id, prediction=prediction, created_at=created_at)
+            .returning(Recording.id)
+        )
+
+    async def add_frames(
+        self, session: AsyncSession, recordings: list[tuple[int, list[StoredFrame], np.ndarray | None]]
+    ) -> None:
+        """Insert the images and keypoints of one or many recordings with one multi-row INSERT per table.
+
+        Args:
+            session (AsyncSession): The database session.
+            recordings (list[tuple[int, list[StoredFrame], np.ndarray | None]]): The recording id, stored frames
+                and keypoint sequence of every recording. Recordings without keypoints only get images.
+        """
+        image_rows = [
+            {"recording_id": recording_id, **img.model_dump()}
+            for recording_id, images, _ in recordings
+            for img in images
+        ]
+        keypoint_rows = [
+            keypoint_service.pack(recording_id, keypoints).model_dump(exclude={"id"})
+            for recording_id, _, keypoints in recordings
+            if keypoints is not None
+        ]
+        if image_rows:
+            await session.execute(insert(Image).values(image_rows))
+        if keypoint_rows:
+            await session.execute(insert(Keypoints).values(keypoint_rows))
+
+    async def save_translation(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        images: list[StoredFrame],
+        keypoints: np.ndarray | None,
+        prediction: str,
+    ) -> int:
+        """Store a recording with its images, keypoints and prediction in a single transaction.
+
+        Args:
+            session (AsyncSession): The database session.
+            user_id (int): The ID of the user who recorded the frames.
+            images (list[StoredFrame]): The frames of the recording in the frame store.
+            keypoints (np.ndarray | None): The keypoint sequence extracted from the frames, if any.
+            prediction (str): The predicted class of the recording.
+
+        Returns:
+            int: The ID of the new recording.
+        """
+        recording_id = await self.add_recording(session, user_id, prediction)
+        await self.add_frames(session, [(recording_id, images, keypoints)])
+        await session.commit()
+        return recording_id
+
+
+recording_service = RecordingService()
@@ -1,76 +1,211 @@
 """Module for """
 import base64
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING
+
 import cv2
-import h5py
 import numpy as np
-import mediapipe as mp
-from tensorflow.keras.models import load_model
+
+from backend.src.models import backend_settings
+from backend.src.services.holistic_pool import HolisticPool
+from backend.src.services.inference_backends import InferenceBackend, load_backend, model_version
+from backend.src.services.keypoints import allocate_sequence, write_keypoints
+
+if TYPE_CHECKING:
+    from mediapipe.python.solutions.holistic import Holistic
 
 
 class TranslationService:
     """Serivce for translating sign language to text."""
 
     def __init__(self):
-        """"""
+        """Create the service without loading any model, see `load`."""
+        self.classes = ["good_job","hello","sleep","thank_you","victory"]
+        self.backend: InferenceBackend | None = None
+        self.model_version: str | None = None
+        self.holistic_pool: HolisticPool | None = None
+        self.live_pool: HolisticPool | None = None
+        self.decode_pool = ThreadPoolExecutor(
+            max_workers=backend_settings.decode_workers, thread_name_prefix="frame-decode"
+        )
+        self.decode_prefetch = backend_settings.decode_prefetch
+        self._ready = threading.Event()
+
+    @property
+    def ready(self) -> bool:
+        """Whether the models are loaded and warmed up."""
+        return self._ready.is_set()
+
+    def load(self, *, classifier: bool = True) -> None:
+        """Load MediaPipe and the classifier and warm them up.
+
+        TensorFlow and MediaPipe are only imported here, so importing the service stays cheap and the
+        application can load the models in the background after start-up.
+
+        Args:
+            classifier (bool): Whether to load the classifier and the live pool, processes that only extract
+                keypoints skip them.
+        """
+        if self.ready:
+            return
+        import mediapipe as mp
+
         self.mp_holistic = mp.solutions.holistic
         self.mp_drawing = mp.solutions.drawing_utils
-        self.model = load_model("backend/model.h5")
-        self.classes = ["good_job","hello","sleep","thank_you","victory"]
+        self.holistic_pool = HolisticPool(
+            self._create_holistic,
+            size=backend_settings.holistic_pool_size,
+            timeout=backend_settings.holistic_pool_timeout_s,
+        )
+        if classifier:
+            # Live connections hold a graph for as long as they are open, so they get their own pool and
+            # can never starve the recordings. A connection over the cap is refused instead of waiting.
+            self.live_pool = HolisticPool(self._create_holistic, size=backend_settings.live_max_connections, timeout=0)
+            # Taken before loading, a model file swapped afterwards is a new version the service does not run.
+            variant = f"{backend_settings.inference_backend}-{backend_settings.tflite_quantization}"
+            self.model_version = model_version(backend_settings.model_path, variant)
+            self.backend = load_backend(
+                backend_settings.inference_backend,
+                backend_settings.model_path,
+                quantization=backend_settings.tflite_quantization,
+                num_threads=backend_settings.tflite_threads,
+            )
+            self.backend.warm_up()
+        self._ready.set()
+
+    def _create_holistic(self) -> "Holistic":
+        """Create a MediaPipe Holistic graph."""
+        return self.mp_holistic.Holistic(min_detection_confidence=0.5, min_tracking_confidence=0.5)
+
+    def decode_frame(self, frame: str | bytes) -> np.ndarray:
+        """Decode a frame into an RGB image.
+
+        Args:
+            frame (str | bytes): The frame as a base64 data URL or as raw encoded image bytes.
+
+        Returns:
+            np.ndarray: The decoded image in RGB format, ready for MediaPipe.
+        """
+        binary = frame if isinstance(frame, bytes) else base64.b64decode(frame.split(",")[1])
+        image = cv2.imdecode(np.frombuffer(binary, dtype=np.uint8), cv2.IMREAD_COLOR)
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
 
     def holistic_detection(self, image, model):
         """
         Przetwarza obraz za pomocą modelu MediaPipe Holistic.
     
         Args:
-            image (np.array): Obraz wejściowy w formacie BGR.
+            image (np.array): Obraz wejściowy w formacie RGB.
             model (mp.solutions.holistic.Holistic): Model MediaPipe Holistic.
     
         Returns:
-            tuple:
-                - np.array: Przetworzony obraz w formacie BGR.
-                - object: Wyniki przetwarzania zawierające landmarki i inne dane.
+            object: Wyniki przetwarzania zawierające landmarki i inne dane.
         """
-        image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
         image.flags.writeable = False
-        results = model.process(image)
-        image.flags.writeable = True
-        image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
-        return image, results
+        return model.process(image)
 
-    def get_points(self, raw_points):
+    def get_points(self, raw_points, out: np.ndarray | None = None):
         """
-        Ekstrahuje współrzędne landmarków z wyników MediaPipe i zwraca je jako spłaszczoną tablicę NumPy.
+        Ekstrahuje współrzędne landmarków z wyników MediaPipe i zapisuje je do wiersza bufora sekwencji.
 
         Args:
             raw_points (object): Wyniki przetwarzania MediaPipe zawierające landmarki.
+            out (np.array | None): Wiersz bufora float32 o długości 1662, do którego zapisywane są współrzędne.
+                Jeśli None, alokowany jest nowy wiersz.
 
         Returns:
-            np.array: Spłaszczona tablica współrzędnych landmarków.
+            np.array: Spłaszczona tablica float32 współrzędnych landmarków.
                 - Pose landmarks: (33 * 4) współrzędne (x, y, z, visibility).
                 - Face landmarks: (468 * 3) współrzędne (x, y, z).
                 - Left hand landmarks: (21 * 3) współrzędne (x, y, z).
                 - Right hand landmarks: (21 * 3) współrzędne (x, y, z).
                 Jeśli brak odpowiednich landmarków, zwracane są tablice wypełnione zerami.
         """
-        pose = np.array([[res.x, res.y, res.z, res.visibility] for res in raw_points.pose_landmarks.landmark]).flatten() if raw_points.pose_landmarks else np.zeros(33 * 4)
-        face = np.array([[res.x, res.y, res.z] for res in raw_points.face_landmarks.landmark]).flatten() if raw_points.face_landmarks else np.zeros(468 * 3)
-        lh = np.array([[res.x, res.y, res.z] for res in raw_points.left_hand_landmarks.landmark]).flatten() if raw_points.left_hand_landmarks else np.zeros(21 * 3)
-        rh = np.array([[res.x, res.y, res.z] for res in raw_points.right_hand_landmarks.landmark]).flatten() if raw_points.right_hand_landmarks else np.zeros(21 * 3)
-        return np.concatenate([pose, face, lh, rh])
-
-    def process_frames(self, frames: list[str]) -> str:
-        to_model = []
-        holistic_model = self.mp_holistic.Holistic(min_detection_confidence=0.5, min_tracking_confidence=0.5)
-        for element in frames:
-            image_b64 = element.split(",")[1]
-            binary = base64.b64decode(image_b64)
-            np_image = np.frombuffer(binary, dtype=np.uint8)
-            image = cv2.imdecode(np_image, cv2.IMREAD_COLOR)
-            image, mp_detection = self.holistic_detection(image, holistic_model)
-            to_model.append(self.get_points(mp_detection))
-
-        res = self.model.predict(np.expand_dims(to_model, axis=0))
-        return self.classes[np.argmax(res)]
+        if out is None:
+            out = allocate_sequence(1)[0]
+        write_keypoints(raw_points, out)
+        return out
+
+    def extract_keypoints(self, frames: list[str] | list[bytes]) -> np.ndarray:
+        """Extract the keypoint sequence of a single recording.
+
+        Args:
+            frames (list[str] | list[bytes]): Recorded frames as base64 data URLs or raw encoded image bytes.
+
+        Returns:
+            np.ndarray: Float32 keypoint sequence of shape (len(frames), 1662).
+        """
+        sequence = allocate_sequence(len(frames))
+        with self.holistic_pool.checkout() as holistic_model:
+            for row, image in zip(sequence, self.iter_decoded(frames), strict=True):
+                self.get_points(self.holistic_detection(image, holistic_model), row)
+        return sequence
+
+    def extract_frame(self, frame: str | bytes, holistic_model: "Holistic", out: np.ndarray) -> None:
+        """Decode one frame of a streamed recording and write its keypoints into a sequence row.
+
+        Args:
+            frame (str | bytes): The frame as a base64 data URL or as raw encoded image bytes.
+            holistic_model (mp.solutions.holistic.Holistic): The graph checked out for the recording.
+            out (np.ndarray): The float32 sequence row to write the keypoints into.
+        """
+        self.get_points(self.holistic_detection(self.decode_frame(frame), holistic_model), out)
+
+    def iter_decoded(self, frames: Iterable[str | bytes]) -> Iterator[np.ndarray]:
+        """Decode frames on the decode thread pool and yield them in order.
+
+        Up to `decode_prefetch` frames are decoded ahead of the consumer, so decoding of the next
+        frames overlaps landmark detection of the current one while memory stays bounded.
+
+        Args:
+            frames (Iterable[str | bytes]): Recorded frames as base64 data URLs or raw encoded image bytes.
+
+        Yields:
+            np.ndarray: The decoded RGB images in frame order.
+        """
+        frames = iter(frames)
+        pending: deque[Future[np.ndarray]] = deque(
+            self.decode_pool.submit(self.decode_frame, frame) for frame in islice(frames, self.decode_prefetch)
+        )
+        try:
+            while pending:
+                image = pending.popleft().result()
+                pending.extend(self.decode_pool.submit(self.decode_frame, frame) for frame in islice(frames, 1))
+                yield image
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def predict_batch(self, sequences: np.ndarray) -> np.ndarray:
+        """Run the classifier on a batch of keypoint sequences.
+
+        Args:
+            sequences (np.ndarray): Keypoint sequences of shape (N, frames, 1662).
+
+        Returns:
+            np.ndarray: Class probabilities of shape (N, len(self.classes)).
+        """
+        return self.backend.predict(sequences)
+
+    def label(self, probabilities: np.ndarray) -> str:
+        """Map the class probabilities of one sequence to its class name."""
+        return self.classes[int(np.argmax(probabilities))]
+
+    def process_frames(self, frames: list[str] | list[bytes]) -> str:
+        """Translate a single recording without batching."""
+        res = self.predict_batch(self.extract_keypoints(frames)[np.newaxis])
+        return self.label(res[0])
+
+    def close(self) -> None:
+        """Release the MediaPipe graphs and the decode threads."""
+        for pool in (self.holistic_pool, self.live_pool):
+            if pool is not None:
+                pool.close()
+        self.decode_pool.shutdown(wait=False, cancel_futures=True)
 
 
 translation_service = TranslationService()
@@ -0,0 +1,95 @@
+"""Execution of the CPU-bound translation pipeline off the asyncio event loop."""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from backend.src.models import backend_settings
+from backend.src.services.tranlsation_service import translation_service
+
+
+def _init_worker() -> None:
+    """Load MediaPipe once when a worker process starts.
+
+    Workers only extract keypoints, the classifier runs batched in the API process.
+    """
+    translation_service.load(classifier=False)
+
+
+def _warm_up() -> None:
+    """No-op task used to make the pool spawn its workers at start-up."""
+
+
+def _extract_keypoints(frames: list[str] | list[bytes]) -> np.ndarray:
+    """Extract the keypoints of a recording inside a worker process."""
+    return translation_service.extract_keypoints(frames)
+
+
+class TranslationExecutor:
+    """Runs frame decoding and landmark extraction outside of the event loop.
+
+    With `workers` greater than zero the pipeline runs in a pool of worker processes, each holding its
+    own `TranslationService`. With zero workers it falls back to in-process execution in a worker thread,
+    which is what tests and single-process setups use.
+
+    Attributes:
+        workers (int): The number of worker processes, 0 for in-process execution.
+    """
+
+    def __init__(self, workers: int) -> None:
+        """Initialize the executor.
+
+        Args:
+            workers (int): The number of worker processes, 0 for in-process execution.
+        """
+        self.workers = workers
+        self._pool: ProcessPoolExecutor | None = None
+        self._started = False
+
+    @property
+    def ready(self) -> bool:
+        """Whether keypoints are extracted in the configured mode."""
+        return self.workers <= 0 or self._started
+
+    async def start(self) -> None:
+        """Start the worker processes and wait until they have loaded their models."""
+        if self.workers <= 0 or self._pool is not None:
+            return
+        # TensorFlow and MediaPipe are not fork-safe, workers have to start from a fresh interpreter.
+        pool = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"), initializer=_init_worker
+        )
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(pool, _warm_up) for _ in range(self.workers)))
+        self._pool = pool
+        self._started = True
+
+    async def stop(self) -> None:
+        """Shut down the worker processes."""
+        if self._pool is None:
+            return
+        pool, self._pool = self._pool, None
+        self._started = False
+        await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
+
+    async def extract_keypoints(self, frames: list[str] | list[bytes]) -> np.ndarray:
+        """Extract the keypoint sequence of a recording without blocking the event loop.
+
+        Args:
+            frames (list[str] | list[bytes]): Recorded frames as base64 data URLs or raw encoded image bytes.
+
+        Returns:
+            np.ndarray: Keypoint sequence of shape (len(frames), 1662).
+        """
+        if self._pool is None:
+            return await asyncio.to_thread(translation_service.extract_keypoints, frames)
+        return await asyncio.get_running_loop().run_in_executor(self._pool, _extract_keypoints, frames)
+
+    def stats(self) -> dict:
+        """Return the execution mode and pool size."""
+        return {"mode": "process" if self._pool is not None else "in-process", "workers": self.workers}
+
+
+translation_executor = TranslationExecutor(workers=backend_settings.translation_workers)
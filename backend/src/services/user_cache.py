@@ -0,0 +1,90 @@
+"""In-process cache of user records."""
+
+import threading
+from typing import NamedTuple
+
+from backend.src.cache import TTLCache
+from backend.src.db_models import UserRead
+from backend.src.models import backend_settings
+
+UserKey = tuple[str, int | str]
+
+
+class FillToken(NamedTuple):
+    """The write generation of a user key, taken before the user is read from the database."""
+
+    key: UserKey
+    generation: int
+
+
+class UserCache:
+    """LRU/TTL cache of users, addressable by id and by username.
+
+    The cache is filled on read and every write to a user updates or invalidates it right after the
+    commit, so a changed `is_active` or `is_admin` flag is never served from it in this process. With
+    several worker processes the time to live bounds how long another process serves a stale entry.
+
+    Every write also bumps a per-key generation counter. A reader takes a `FillToken` before its SELECT
+    and `fill` skips the row if a write happened in between, so a row read before a commit can never
+    overwrite the entry the write just set.
+    """
+
+    def __init__(self, capacity: int, ttl_seconds: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            capacity (int): The maximum number of cached users, 0 disables the cache.
+            ttl_seconds (float): How long a user stays cached.
+        """
+        # Every user takes one entry per key it is addressable by.
+        self._cache: TTLCache[UserKey, UserRead] = TTLCache(2 * capacity, ttl_seconds)
+        # Only keys of written users get a generation, so this grows with the number of users at most.
+        self._generations: dict[UserKey, int] = {}
+        self._lock = threading.Lock()
+
+    def get_by_id(self, user_id: int) -> UserRead | None:
+        """Return the cached user with an id, None on a miss."""
+        return self._cache.get(("id", user_id))
+
+    def get_by_username(self, username: str) -> UserRead | None:
+        """Return the cached user with a username, None on a miss."""
+        return self._cache.get(("username", username))
+
+    def fill_token(self, *, user_id: int | None = None, username: str | None = None) -> FillToken:
+        """Return the token to pass to `fill` once the user with an id or a username has been read."""
+        key = ("id", user_id) if username is None else ("username", username)
+        with self._lock:
+            return FillToken(key, self._generations.get(key, 0))
+
+    def fill(self, user: UserRead, token: FillToken) -> None:
+        """Cache a user read from the database, unless it was written since the token was taken."""
+        with self._lock:
+            if self._generations.get(token.key, 0) == token.generation:
+                self._cache.set(("id", user.id), user)
+                self._cache.set(("username", user.username), user)
+
+    def set(self, user: UserRead) -> None:
+        """Cache a user after a write, under its id and its username."""
+        with self._lock:
+            self._bump(("id", user.id), ("username", user.username))
+            self._cache.set(("id", user.id), user)
+            self._cache.set(("username", user.username), user)
+
+    def invalidate(self, user_id: int, username: str) -> None:
+        """Remove a user from the cache after a write, by the username it had before the write."""
+        with self._lock:
+            self._bump(("id", user_id), ("username", username))
+            self._cache.pop(("id", user_id))
+            self._cache.pop(("username", username))
+
+    def _bump(self, *keys: UserKey) -> None:
+        """Increment the write generation of keys."""
+        for key in keys:
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def stats(self) -> dict:
+        """Return the cache statistics."""
+        return self._cache.stats()
+
+
+user_cache = UserCache(backend_settings.user_cache_size, backend_settings.user_cache_ttl_s)
@@ -1,6 +1,50 @@
 """Utils module for the Sign Language Translator application."""
 
+import base64
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO
+
 
 def hash_password(password: str) -> str:
     """TMP function to hash a password."""
     return f"hashed_{password}"
+
+
+def sniff_image_type(content: bytes) -> str:
+    """Return the MIME type of raw JPEG/PNG image bytes, defaulting to JPEG."""
+    if content.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    return "image/jpeg"
+
+
+def decode_data_url(data_url: str) -> bytes:
+    """Return the raw bytes of a base64 data URL such as `data:image/png;base64,...`."""
+    return base64.b64decode(data_url.split(",", 1)[1])
+
+
+@contextmanager
+def atomic_write(path: str | Path) -> Iterator[BinaryIO]:
+    """Open a temporary file next to a path for writing and rename it over the path once the block succeeds.
+
+    Readers see either the previous file or the complete new one, never a partial write. If the block
+    raises, the temporary file is removed and the path is left untouched.
+
+    Args:
+        path (str | Path): The file to write.
+
+    Yields:
+        BinaryIO: The temporary file, opened for binary writing.
+    """
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            yield tmp
+        Path(tmp_path).replace(path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
@@ -0,0 +1,11 @@
+"""Shared test configuration.
+
+The backend settings are read from the environment when the services are imported, so the required
+ones get test values here, before any test module imports a service.
+"""
+
+import os
+import tempfile
+
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("FRAME_STORE_ROOT", tempfile.mkdtemp(prefix="frames-"))
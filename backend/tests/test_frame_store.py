@@ -0,0 +1,48 @@
+"""Tests of the local frame store."""
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from backend.src.services.frame_store import LocalFrameStore
+
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(range(256))
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> LocalFrameStore:
+    """A frame store in a temporary directory."""
+    return LocalFrameStore(tmp_path / "frames")
+
+
+def test_put_and_read(store: LocalFrameStore) -> None:
+    """A stored frame is keyed by its SHA-256 digest and read back unchanged."""
+    stored = store.put(PNG)
+
+    assert stored.content_hash == hashlib.sha256(PNG).hexdigest()
+    assert stored.size == len(PNG)
+    assert stored.format == "png"
+    assert store.read(stored.content_hash) == PNG
+    assert store.put(PNG) == stored
+
+
+@pytest.mark.parametrize(
+    "content_hash",
+    [
+        "../../../../etc/passwd",
+        "/etc/passwd",
+        "ab/../../" + "0" * 55,
+        "A" * 64,
+        "0" * 63,
+        "0" * 65,
+        "0" * 64 + "\n",
+        "",
+    ],
+)
+def test_rejects_hashes_that_are_not_digests(store: LocalFrameStore, content_hash: str) -> None:
+    """Anything but 64 lowercase hex characters is treated as a missing frame and never touches the filesystem."""
+    with pytest.raises(FileNotFoundError, match="Invalid frame content hash"):
+        store.path(content_hash)
+    with pytest.raises(FileNotFoundError):
+        store.read(content_hash)
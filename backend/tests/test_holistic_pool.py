@@ -0,0 +1,48 @@
+"""Tests of the pool of MediaPipe Holistic graphs, with stand-in graphs."""
+
+import pytest
+
+from backend.src.services.holistic_pool import HolisticPool
+
+
+class FakeHolistic:
+    """A stand-in for a MediaPipe Holistic graph."""
+
+    def reset(self) -> None:
+        """Drop the tracking state."""
+
+    def close(self) -> None:
+        """Release the graph."""
+
+
+def test_timed_out_checkouts_are_counted() -> None:
+    """A checkout refused because no graph is free counts as exhausted and as a timeout."""
+    pool = HolisticPool(FakeHolistic, size=1, timeout=0)
+
+    with pool.checkout(), pytest.raises(TimeoutError), pool.checkout():
+        pass
+
+    stats = pool.stats()
+    assert stats["checkouts"] == 1
+    assert stats["exhausted"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["idle"] == 1
+
+
+def test_checkouts_return_graphs() -> None:
+    """Graphs are returned to the pool after a checkout, without any timeout."""
+    pool = HolisticPool(FakeHolistic, size=1, timeout=0)
+
+    for _ in range(3):
+        with pool.checkout() as holistic:
+            assert isinstance(holistic, FakeHolistic)
+
+    assert pool.stats() | {"avg_wait_ms": 0, "max_wait_ms": 0} == {
+        "size": 1,
+        "idle": 1,
+        "checkouts": 3,
+        "exhausted": 0,
+        "timeouts": 0,
+        "avg_wait_ms": 0,
+        "max_wait_ms": 0,
+    }
@@ -0,0 +1,51 @@
+"""Tests of the TFLite backend against the Keras backend on a small generated model."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from backend.src.services.inference_backends import TFLITE_QUANTIZATIONS, KerasBackend, TFLiteBackend
+from backend.src.services.keypoints import KEYPOINT_DTYPE, KEYPOINT_FEATURES, SEQUENCE_LENGTH
+
+tf = pytest.importorskip("tensorflow")
+
+CLASSES = 5
+SEQUENCES = 64
+# Dynamic-range int8 weights may flip near-ties between two classes.
+MIN_AGREEMENT = {"float32": 1.0, "float16": 1.0, "int8": 0.95}
+
+
+@pytest.fixture(scope="module")
+def model_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Save a small LSTM classifier with the input shape of the sign classifier."""
+    tf.keras.utils.set_random_seed(0)
+    model = tf.keras.Sequential(
+        [
+            tf.keras.Input((SEQUENCE_LENGTH, KEYPOINT_FEATURES)),
+            tf.keras.layers.LSTM(16),
+            tf.keras.layers.Dense(CLASSES, activation="softmax"),
+        ]
+    )
+    path = tmp_path_factory.mktemp("model") / "model.h5"
+    model.save(path)
+    return path
+
+
+@pytest.fixture(scope="module")
+def sequences() -> np.ndarray:
+    """Random keypoint sequences in the [0, 1) range of MediaPipe coordinates."""
+    return np.random.default_rng(0).random((SEQUENCES, SEQUENCE_LENGTH, KEYPOINT_FEATURES), dtype=KEYPOINT_DTYPE)
+
+
+@pytest.mark.parametrize("quantization", TFLITE_QUANTIZATIONS)
+def test_tflite_argmax_matches_keras(model_path: Path, sequences: np.ndarray, quantization: str) -> None:
+    """Every TFLite variant predicts the same classes as the Keras model."""
+    expected = KerasBackend(str(model_path)).predict(sequences)
+    predicted = TFLiteBackend(str(model_path), quantization).predict(sequences)
+
+    assert predicted.shape == (SEQUENCES, CLASSES)
+    agreement = np.mean(predicted.argmax(axis=1) == expected.argmax(axis=1))
+    assert agreement >= MIN_AGREEMENT[quantization]
+    if quantization == "float32":
+        np.testing.assert_allclose(predicted, expected, atol=1e-5)
@@ -0,0 +1,82 @@
+"""Tests of the keypoint layout against the original `get_points` extraction."""
+
+import itertools
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from backend.src.services.keypoints import (
+    FACE_LANDMARKS,
+    HAND_LANDMARKS,
+    KEYPOINT_DTYPE,
+    KEYPOINT_FEATURES,
+    POSE_LANDMARKS,
+    allocate_sequence,
+    write_keypoints,
+)
+
+PARTS = ("pose_landmarks", "face_landmarks", "left_hand_landmarks", "right_hand_landmarks")
+
+
+def landmark_list(rng: np.random.Generator, count: int) -> SimpleNamespace:
+    """Build a MediaPipe-like landmark list with random coordinates."""
+    return SimpleNamespace(
+        landmark=[SimpleNamespace(x=x, y=y, z=z, visibility=v) for x, y, z, v in rng.random((count, 4))]
+    )
+
+
+def get_points(raw_points: SimpleNamespace) -> np.ndarray:
+    """Extract the landmarks the way `TranslationService.get_points` did before the keypoint buffer."""
+    pose = (
+        np.array([[res.x, res.y, res.z, res.visibility] for res in raw_points.pose_landmarks.landmark]).flatten()
+        if raw_points.pose_landmarks
+        else np.zeros(33 * 4)
+    )
+    face = (
+        np.array([[res.x, res.y, res.z] for res in raw_points.face_landmarks.landmark]).flatten()
+        if raw_points.face_landmarks
+        else np.zeros(468 * 3)
+    )
+    lh = (
+        np.array([[res.x, res.y, res.z] for res in raw_points.left_hand_landmarks.landmark]).flatten()
+        if raw_points.left_hand_landmarks
+        else np.zeros(21 * 3)
+    )
+    rh = (
+        np.array([[res.x, res.y, res.z] for res in raw_points.right_hand_landmarks.landmark]).flatten()
+        if raw_points.right_hand_landmarks
+        else np.zeros(21 * 3)
+    )
+    return np.concatenate([pose, face, lh, rh])
+
+
+@pytest.mark.parametrize("present", list(itertools.product((True, False), repeat=len(PARTS))))
+def test_write_keypoints_matches_get_points(present: tuple[bool, ...]) -> None:
+    """Every combination of detected and missing parts gives the original layout as float32."""
+    rng = np.random.default_rng(sum(bit << i for i, bit in enumerate(present)))
+    counts = (POSE_LANDMARKS, FACE_LANDMARKS, HAND_LANDMARKS, HAND_LANDMARKS)
+    results = SimpleNamespace(
+        **{
+            part: landmark_list(rng, count) if detected else None
+            for part, count, detected in zip(PARTS, counts, present, strict=True)
+        }
+    )
+    # Garbage in the buffer must not leak into the zero-filled parts of a reused row.
+    out = np.full(KEYPOINT_FEATURES, np.nan, dtype=KEYPOINT_DTYPE)
+
+    write_keypoints(results, out)
+
+    expected = get_points(results)
+    assert expected.shape == (KEYPOINT_FEATURES,)
+    assert out.dtype == KEYPOINT_DTYPE
+    np.testing.assert_array_equal(out, expected.astype(KEYPOINT_DTYPE))
+
+
+def test_allocate_sequence() -> None:
+    """The sequence buffer is a zeroed float32 array of one row per frame."""
+    sequence = allocate_sequence(5)
+
+    assert sequence.shape == (5, KEYPOINT_FEATURES)
+    assert sequence.dtype == KEYPOINT_DTYPE
+    assert not sequence.any()
@@ -0,0 +1,83 @@
+"""Tests that the hot lookups are answered from their indexes, on the PostgreSQL database of the settings."""
+
+import asyncio
+import json
+from collections.abc import Iterator
+
+import pytest
+
+pytest.importorskip("asyncpg")
+pytest.importorskip("sqlmodel")
+
+from pydantic import ValidationError
+from sqlalchemy import Executable, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel import SQLModel, select
+
+from backend.src.config import DBSettings
+from backend.src.db_models import Image, Recording, User
+
+try:
+    db_settings = DBSettings()
+except ValidationError:
+    pytest.skip("No PostgreSQL database is configured", allow_module_level=True)
+
+LOOKUPS = {
+    "login": (select(User).where(User.username == "alice"), "ix_user_username"),
+    "register_email": (select(User.id).where(User.email == "alice@example.com").limit(1), "ix_user_email"),
+    "recordings_of_user": (select(Recording).where(Recording.user_id == 1), "ix_recording_user_id"),
+    "images_of_recording": (select(Image).where(Image.recording_id == 1), "ix_image_recording_id"),
+}
+
+
+def plan_nodes(plan: dict) -> Iterator[dict]:
+    """Yield a query plan node and all of its descendants."""
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+async def explain_lookups() -> dict[str, dict]:
+    """Return the JSON query plan of every lookup.
+
+    The tables are created if missing, never dropped. Sequential scans are disabled for the session,
+    so the planner uses an index whenever one can answer the query, even on the small tables of a
+    test database.
+    """
+    engine = create_async_engine(db_settings.database_url, poolclass=NullPool)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+            await conn.execute(text("SET LOCAL enable_seqscan = off"))
+            plans = {}
+            for name, (statement, _) in LOOKUPS.items():
+                sql = compile_literal(statement)
+                result = await conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+                plan = result.scalar_one()
+                plans[name] = (json.loads(plan) if isinstance(plan, str) else plan)[0]["Plan"]
+            return plans
+    finally:
+        await engine.dispose()
+
+
+def compile_literal(statement: Executable) -> str:
+    """Render a statement as PostgreSQL SQL with its parameters inlined."""
+    return str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+@pytest.fixture(scope="module")
+def plans() -> dict[str, dict]:
+    """The query plans of all lookups, explained in one connection."""
+    return asyncio.run(explain_lookups())
+
+
+@pytest.mark.parametrize("lookup", LOOKUPS)
+def test_lookup_uses_index(plans: dict[str, dict], lookup: str) -> None:
+    """The lookup is an index (only) scan or a bitmap index scan on its index, never a sequential scan."""
+    _, index_name = LOOKUPS[lookup]
+    nodes = list(plan_nodes(plans[lookup]))
+
+    assert not any(node["Node Type"] == "Seq Scan" for node in nodes)
+    assert index_name in {node.get("Index Name") for node in nodes}
@@ -0,0 +1,62 @@
+"""Tests of the user cache against fills racing with writes."""
+
+import pytest
+
+pytest.importorskip("sqlmodel")
+
+from backend.src.db_models import UserRead
+from backend.src.services.user_cache import UserCache
+
+
+def make_user(*, username: str = "alice", is_active: bool = True) -> UserRead:
+    """Return a user record."""
+    return UserRead(
+        id=1,
+        username=username,
+        email="alice@example.com",
+        is_active=is_active,
+        is_admin=False,
+        hashed_password="x",  # noqa: S106
+    )
+
+
+@pytest.mark.parametrize("by_username", [False, True])
+def test_fill_after_a_concurrent_write_is_skipped(by_username: bool) -> None:  # noqa: FBT001
+    """A row read before a write committed does not replace the entry the write set."""
+    cache = UserCache(capacity=16, ttl_seconds=60)
+    stale = make_user()
+    token = cache.fill_token(username="alice") if by_username else cache.fill_token(user_id=1)
+
+    # The write commits while the reader awaits its SELECT, which returned the row before the commit.
+    cache.invalidate(1, "alice")
+    cache.set(make_user(is_active=False))
+    cache.fill(stale, token)
+
+    assert not cache.get_by_id(1).is_active
+    assert not cache.get_by_username("alice").is_active
+
+
+def test_fill_after_a_rename_is_skipped() -> None:
+    """A reader by the old username does not cache the user back under it after a rename."""
+    cache = UserCache(capacity=16, ttl_seconds=60)
+    token = cache.fill_token(username="alice")
+
+    cache.invalidate(1, "alice")
+    cache.set(make_user(username="bob"))
+    cache.fill(make_user(), token)
+
+    assert cache.get_by_username("alice") is None
+    assert cache.get_by_id(1).username == "bob"
+
+
+def test_fill_without_a_concurrent_write() -> None:
+    """A row read without a write in between is cached under its id and its username."""
+    cache = UserCache(capacity=16, ttl_seconds=60)
+    cache.set(make_user())
+    cache.invalidate(1, "alice")
+    token = cache.fill_token(user_id=1)
+
+    cache.fill(make_user(), token)
+
+    assert cache.get_by_id(1) == make_user()
+    assert cache.get_by_username("alice") == make_user()
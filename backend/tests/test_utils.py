@@ -0,0 +1,37 @@
+"""Tests of the shared helpers."""
+
+from pathlib import Path
+
+import pytest
+
+from backend.src.utils import atomic_write
+
+
+def test_atomic_write_replaces_the_file(tmp_path: Path) -> None:
+    """The new content replaces the file once the block completes, leaving no temporary file behind."""
+    path = tmp_path / "shard.npz"
+    path.write_bytes(b"old")
+
+    with atomic_write(path) as tmp:
+        tmp.write(b"new")
+        assert path.read_bytes() == b"old"
+
+    assert path.read_bytes() == b"new"
+    assert [child.name for child in tmp_path.iterdir()] == ["shard.npz"]
+
+
+def test_atomic_write_keeps_the_file_on_error(tmp_path: Path) -> None:
+    """A failing block leaves the previous file untouched and removes the temporary file."""
+    path = tmp_path / "shard.npz"
+    path.write_bytes(b"old")
+
+    def write_partially() -> None:
+        with atomic_write(path) as tmp:
+            tmp.write(b"partial")
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        write_partially()
+
+    assert path.read_bytes() == b"old"
+    assert [child.name for child in tmp_path.iterdir()] == ["shard.npz"]
@@ -3,8 +3,13 @@
 import streamlit as st
 import streamlit.components.v1 as components
 
+from frontend.models import frontend_settings
+
 # Get user_id from session state (default to an empty string if not found)
 user_id = st.session_state.get("user_id", "")
+# "binary" uploads raw JPEG frames as multipart parts, "json" sends base64 data URLs,
+# "websocket" streams every frame to the backend as soon as it is captured
+transport = frontend_settings.translate_transport
 
 html_code = f"""
 <!DOCTYPE html>
@@ -68,6 +73,7 @@ html_code = f"""
     <!-- Inject user_id for use in JavaScript -->
     <script>
       const USER_ID = "{user_id}";
+      const TRANSPORT = "{transport}";
       console.log("Active user_id:", USER_ID);
     </script>
 
@@ -100,6 +106,16 @@ html_code = f"""
       }})
       .catch(err => console.error("Error accessing camera:", err));
 
+    // Streamed frames are translated while recording, the prediction arrives on the socket
+    const socket = TRANSPORT === "websocket" ? new WebSocket("ws://localhost/translate/stream") : null;
+    if (socket) {{
+      socket.onmessage = event => showPrediction(JSON.parse(event.data));
+      socket.onerror = error => {{
+        console.error("Error streaming frames:", error);
+        predictionText.textContent = "Error sending frames.";
+      }};
+    }}
+
     // Handle capture button click
     captureBtn.addEventListener("click", () => {{
       startCountdown(3);
@@ -124,19 +140,33 @@ html_code = f"""
       const framesToCapture = 30;
       const intervalDelay = 100; // Capture every 100ms
       let frameCount = 0;
+      // Keeps streamed frames in capture order while they are being encoded
+      let streamChain = Promise.resolve();
+      if (socket) {{
+        socket.send(JSON.stringify({{ user_id: Number(USER_ID) }}));
+      }}
 
       const intervalID = setInterval(() => {{
         const canvas = document.createElement("canvas");
         canvas.width = video.videoWidth;
         canvas.height = video.videoHeight;
         canvas.getContext("2d").drawImage(video, 0, 0);
-        frames.push(canvas.toDataURL("image/png"));
+        if (socket) {{
+          const blob = new Promise(resolve => canvas.toBlob(resolve, "image/jpeg", 0.92));
+          streamChain = streamChain.then(() => blob).then(frame => socket.send(frame));
+        }} else if (TRANSPORT === "binary") {{
+          frames.push(new Promise(resolve => canvas.toBlob(resolve, "image/jpeg", 0.92)));
+        }} else {{
+          frames.push(canvas.toDataURL("image/png"));
+        }}
         frameCount++;
         updateProgressBar(frameCount, framesToCapture);
 
         if (frameCount >= framesToCapture) {{
           clearInterval(intervalID);
-          sendFrames(frames);
+          if (!socket) {{
+            sendFrames(frames);
+          }}
         }}
       }}, intervalDelay);
     }}
@@ -146,36 +176,49 @@ html_code = f"""
       progressBar.style.width = percentage + "%";
     }}
 
-    function sendFrames(frames) {{
-      // Pass user_id to the backend along with frames
-      fetch("http://localhost/translate", {{
+    async function postFrames(frames) {{
+      if (TRANSPORT === "binary") {{
+        // Raw image bytes as multipart parts, without base64 inflation
+        const body = new FormData();
+        body.append("user_id", USER_ID);
+        (await Promise.all(frames)).forEach((blob, i) => body.append("frames", blob, `frame_${{i}}.jpg`));
+        return fetch("http://localhost/translate/binary", {{ method: "POST", body: body }});
+      }}
+      return fetch("http://localhost/translate", {{
         method: "POST",
         headers: {{ "Content-Type": "application/json" }},
         body: JSON.stringify({{
           frames: frames,
           user_id: USER_ID
         }})
-      }})
+      }});
+    }}
+
+    function sendFrames(frames) {{
+      // Pass user_id to the backend along with frames
+      postFrames(frames)
       .then(response => response.json())
-      .then(data => {{
-        predictionText.textContent = `Prediction: ${{data.prediction}}`;
-        likeBtn.disabled = false;
-        dislikeBtn.disabled = false;
-
-        likeBtn.addEventListener("click", () => {{
-          sendFeedback(data.recording_id, 1); // Like (1)
-        }});
-
-        dislikeBtn.addEventListener("click", () => {{
-          sendFeedback(data.recording_id, 0); // Dislike (0)
-        }});
-      }})
+      .then(showPrediction)
       .catch(error => {{
         console.error("Error sending frames:", error);
         predictionText.textContent = "Error sending frames.";
       }});
     }}
 
+    function showPrediction(data) {{
+      predictionText.textContent = `Prediction: ${{data.prediction}}`;
+      likeBtn.disabled = false;
+      dislikeBtn.disabled = false;
+
+      likeBtn.addEventListener("click", () => {{
+        sendFeedback(data.recording_id, 1); // Like (1)
+      }});
+
+      dislikeBtn.addEventListener("click", () => {{
+        sendFeedback(data.recording_id, 0); // Dislike (0)
+      }});
+    }}
+
     function sendFeedback(recordingId, feedback) {{
       feedbackMessage.style.display = "block";
       feedbackMessage.style.color = "black";
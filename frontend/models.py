@@ -8,6 +8,13 @@ class FrontendSettings(BaseSettings):
     """Frontend settings model."""
 
     backend_server: str
+    translate_transport: str = "binary"
+    api_timeout_s: float = 10.0
+    api_retries: int = 3
+    api_pool_size: int = 10
+    api_cache_ttl_s: float = 5.0
+    api_cache_max_entries: int = 256
+    api_cache_max_age_s: float = 300.0
 
 
 class LoginRequest(BaseModel):
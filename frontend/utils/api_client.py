@@ -0,0 +1,165 @@
+"""Shared HTTP client for the backend API."""
+
+import threading
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class ApiClient:
+    """HTTP client for the backend API with connection pooling, retries and a short-lived GET cache.
+
+    One client is shared by all Streamlit sessions of the process, so connections to the backend are
+    kept alive between requests. Idempotent requests are retried with exponential backoff on connection
+    errors and 502/503/504 responses. Successful GET responses are cached for a few seconds, and every
+    write through the client drops the whole cache so it never serves data older than the write. Once
+    a cached response with an ETag expires, it is revalidated with If-None-Match and reused if the
+    backend answers 304 Not Modified. The cache is bounded: it holds at most `cache_max_entries`
+    responses, evicting the least recently used first, and drops a response once it is older than
+    `cache_max_age_seconds`, expired or not.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        base_url: str,
+        *,
+        timeout: float = 10.0,
+        retries: int = 3,
+        backoff_factor: float = 0.3,
+        pool_size: int = 10,
+        cache_ttl_seconds: float = 5.0,
+        cache_max_entries: int = 256,
+        cache_max_age_seconds: float = 300.0,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            base_url: The URL of the backend, e.g. "http://backend:8000".
+            timeout: The timeout of a request in seconds.
+            retries: The maximum number of retries of an idempotent request.
+            backoff_factor: The base of the exponential backoff between retries, in seconds.
+            pool_size: The maximum number of kept-alive connections to the backend.
+            cache_ttl_seconds: How long a GET response stays cached, 0 disables the cache.
+            cache_max_entries: The maximum number of cached GET responses.
+            cache_max_age_seconds: How long an expired response is kept for revalidation with its ETag.
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.cache_max_entries = cache_max_entries
+        self.cache_max_age_seconds = cache_max_age_seconds
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Key -> (expires at, stored at, response), in least recently used order.
+        self._cache: OrderedDict[tuple, tuple[float, float, requests.Response]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        path: str,
+        *,
+        params: dict | None = None,
+        cache: bool = True,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> requests.Response:
+        """Send a GET request, answering from the cache if an identical request succeeded recently.
+
+        An expired cached response is revalidated with its ETag instead of being downloaded again.
+
+        Args:
+            path: The path of the endpoint, e.g. "/users/".
+            params: The query parameters.
+            cache: Whether the response may come from and go into the cache.
+            **kwargs: Further arguments of `requests.Session.request`.
+
+        Returns:
+            requests.Response: The response.
+        """
+        key = (path, tuple(sorted((params or {}).items())))
+        entry = self._cache_get(key) if cache else None
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[2]
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry is not None and "ETag" in entry[2].headers:
+            headers["If-None-Match"] = entry[2].headers["ETag"]
+        response = self.request("GET", path, params=params, headers=headers, **kwargs)
+        if entry is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+            response = entry[2]
+        if cache and self.cache_ttl_seconds > 0 and response.ok:
+            self._cache_set(key, response)
+        elif cache:
+            with self._lock:
+                self._cache.pop(key, None)
+        return response
+
+    def post(self, path: str, **kwargs: Any) -> requests.Response:  # noqa: ANN401
+        """Send a POST request and invalidate the cache."""
+        return self._write("POST", path, **kwargs)
+
+    def put(self, path: str, **kwargs: Any) -> requests.Response:  # noqa: ANN401
+        """Send a PUT request and invalidate the cache."""
+        return self._write("PUT", path, **kwargs)
+
+    def patch(self, path: str, **kwargs: Any) -> requests.Response:  # noqa: ANN401
+        """Send a PATCH request and invalidate the cache."""
+        return self._write("PATCH", path, **kwargs)
+
+    def delete(self, path: str, **kwargs: Any) -> requests.Response:  # noqa: ANN401
+        """Send a DELETE request and invalidate the cache."""
+        return self._write("DELETE", path, **kwargs)
+
+    def request(self, method: str, path: str, **kwargs: Any) -> requests.Response:  # noqa: ANN401
+        """Send a request over the pooled session, bypassing the cache."""
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, f"{self.base_url}{path}", **kwargs)
+
+    def invalidate(self) -> None:
+        """Drop all cached GET responses."""
+        with self._lock:
+            self._cache.clear()
+
+    def _cache_get(self, key: tuple) -> tuple[float, float, requests.Response] | None:
+        """Return the cache entry of a key, dropping it if it is older than the maximum age."""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if entry[1] + self.cache_max_age_seconds <= time.monotonic():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return entry
+
+    def _cache_set(self, key: tuple, response: requests.Response) -> None:
+        """Cache a response, evicting the least recently used entries beyond the maximum count."""
+        now = time.monotonic()
+        with self._lock:
+            self._cache[key] = (now + self.cache_ttl_seconds, now, response)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_max_entries:
+                self._cache.popitem(last=False)
+
+    def _write(self, method: str, path: str, **kwargs: Any) -> requests.Response:  # noqa: ANN401
+        """Send a request that changes data and drop the cached responses it may have made stale."""
+        try:
+            return self.request(method, path, **kwargs)
+        finally:
+            self.invalidate()
@@ -7,6 +7,21 @@ import streamlit as st
 from pydantic import ValidationError
 
 from frontend.models import frontend_settings, LoginRequest, LoginResponse, RegisterUserRequest, UserRequest
+from frontend.utils.api_client import ApiClient
+
+
+@st.cache_resource
+def get_api_client() -> ApiClient:
+    """Return the API client shared by all sessions of the Streamlit process."""
+    return ApiClient(
+        f"http://{frontend_settings.backend_server}",
+        timeout=frontend_settings.api_timeout_s,
+        retries=frontend_settings.api_retries,
+        pool_size=frontend_settings.api_pool_size,
+        cache_ttl_seconds=frontend_settings.api_cache_ttl_s,
+        cache_max_entries=frontend_settings.api_cache_max_entries,
+        cache_max_age_seconds=frontend_settings.api_cache_max_age_s,
+    )
 
 
 def api_login(request_data: LoginRequest) -> LoginResponse | dict:
@@ -19,11 +34,8 @@ def api_login(request_data: LoginRequest) -> LoginResponse | dict:
         LoginResponse: LoginResponse object with access token and admin status.
     """
     try:
-        with requests.post(
-            url=f"http://{frontend_settings.backend_server}/auth/login",
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            data=request_data.dict(),
-            timeout=10,
+        with get_api_client().post(
+            "/auth/login", headers={"Content-Type": "application/x-www-form-urlencoded"}, data=request_data.dict()
         ) as response:
             if response.status_code == HTTPStatus.OK:
                 try:
@@ -50,12 +62,7 @@ def api_register(request_data: RegisterUserRequest) -> LoginResponse | dict:
         dict: Response message.
     """
     try:
-        with requests.post(
-            url=f"http://{frontend_settings.backend_server}/auth/register",
-            headers={"Content-Type": "application/json"},
-            json=request_data.dict(),
-            timeout=10,
-        ) as response:
+        with get_api_client().post("/auth/register", json=request_data.dict()) as response:
             if response.status_code == HTTPStatus.OK:
                 return LoginResponse(**response.json())
             if response.status_code == HTTPStatus.CONFLICT:
@@ -66,43 +73,47 @@ def api_register(request_data: RegisterUserRequest) -> LoginResponse | dict:
         raise requests.HTTPError(msg) from e
 
 
-def api_get_users() -> list[UserRequest]:
-    """Get all users from database.
+def api_get_users(page_size: int = 500) -> list[UserRequest]:
+    """Get all users from database, page by page.
+
+    Args:
+        page_size: Number of users fetched per request.
 
     Returns:
         list: List of all users.
     """
+    users = []
+    params = {"limit": page_size}
     try:
-        with requests.get(
-            url=f"http://{frontend_settings.backend_server}/users", headers={"Content-Type": "application/json"}, timeout=10
-        ) as response:
+        while True:
+            response = get_api_client().get("/users/", params=params)
             response.raise_for_status()
-            return response.json()
+            page = response.json()
+            users.extend(page["items"])
+            if page["next_cursor"] is None:
+                return users
+            params["cursor"] = page["next_cursor"]
     except requests.RequestException as e:
         msg = f"Get users request failed: {e}"
         raise requests.HTTPError(msg) from e
 
 
-def api_update_user(request_data: list[UserRequest]) -> True:
-    """Update user details.
+def api_update_user(request_data: list[UserRequest]) -> bool:
+    """Update user details of many users in one request.
 
     Args:
-        request_data: UserRequest object with email, is_admin, and user_name and is_active.
+        request_data: UserRequest objects with id, email, is_admin, user_name and is_active.
 
     Returns:
-        True if the update was successful, False otherwise.
+        True if all users were updated, False otherwise.
     """
-    resp_stat = []
     try:
-        for user in request_data:
-            response = requests.put(
-                url=f"http://{frontend_settings.backend_server}/users/{user.id}",
-                headers={"Content-Type": "application/json"},
-                json=user.dict(exclude={"id"}),
-                timeout=10,
-            )
-            resp_stat.append(response.status_code)
-        return all(status == HTTPStatus.OK for status in resp_stat)
+        with get_api_client().patch(
+            "/users/", json=[user.dict(exclude={"hashed_password"}) for user in request_data]
+        ) as response:
+            if response.status_code != HTTPStatus.OK:
+                return False
+            return all(result["status"] == "updated" for result in response.json())
     except requests.RequestException as e:
         msg = f"Update user request failed: {e}"
         raise requests.HTTPError(msg) from e